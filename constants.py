@@ -3,8 +3,11 @@ Constants
 All magic numbers and constant values used throughout the application.
 """
 
+from types import MappingProxyType
+
 # Maya set naming
 SET_PREFIX = "batchExport_"
+SET_PREFIX_LEN = len(SET_PREFIX)
 
 # UI refresh timing (milliseconds)
 REFRESH_INTERVAL_MS = 500
@@ -39,6 +42,15 @@ DEFAULT_CONVERT_UNIT = "cm"
 DEFAULT_EXPORT_DIRECTORY = ""
 DEFAULT_FILE_PREFIX = ""
 
+# Read-only template of the defaults above; copy it with dict() for a settings dict
+DEFAULT_FBX_SETTINGS = MappingProxyType({
+    "up_axis": DEFAULT_UP_AXIS,
+    "triangulate": DEFAULT_TRIANGULATE,
+    "convert_unit": DEFAULT_CONVERT_UNIT,
+    "export_directory": DEFAULT_EXPORT_DIRECTORY,
+    "file_prefix": DEFAULT_FILE_PREFIX,
+})
+
 # Available options
 AVAILABLE_UP_AXES = ["Y", "Z"]
 AVAILABLE_UNITS = ["cm", "m", "mm", "in", "ft"]
@@ -3,6 +3,8 @@ Dependency Injection Container
 Simple DI container for managing dependencies.
 """
 
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 from .maya_facade import MayaSceneAdapter, MayaSceneInterface
 from .set_manager import SetManager
 from .persistence import JsonConfigRepository, ConfigPathResolver, ConfigRepository
@@ -16,97 +18,115 @@ logger = get_logger(__name__)
 
 
 class Container:
-    """Dependency injection container."""
+    """Dependency injection container with lazily constructed dependencies."""
+    
+    __slots__ = ("_instances", "_providers", "_initialized", "_lock")
     
     def __init__(self):
         """Initialize the container."""
-        self._instances = {}
+        self._instances: Dict[str, Any] = {}
+        self._providers: Dict[str, Tuple[Callable[[], Any], bool]] = {}
         self._initialized = False
+        self._lock = threading.Lock()
     
     def initialize(self) -> None:
-        """Initialize all dependencies."""
-        if self._initialized:
-            logger.warning("Container already initialized")
-            return
-        
+        """Register providers for all dependencies (instances are built on first access)."""
+        with self._lock:
+            if self._initialized:
+                logger.warning("Container already initialized")
+                return
+            self._register_providers()
+            self._initialized = True
+        logger.info("Dependency container initialized")
+    
+    def _register_providers(self) -> None:
+        """Register the provider for each dependency."""
         logger.info("Initializing dependency container")
         
-        # Create Maya facade
-        maya_scene = MayaSceneAdapter()
-        self._instances['maya_scene'] = maya_scene
-        
-        # Create managers
-        set_manager = SetManager(maya_scene)
-        self._instances['set_manager'] = set_manager
-        
-        config_repository = JsonConfigRepository()
-        self._instances['config_repository'] = config_repository
+        # Maya facade
+        self._register('maya_scene', MayaSceneAdapter)
         
-        path_resolver = ConfigPathResolver(maya_scene)
-        self._instances['path_resolver'] = path_resolver
+        # Managers
+        self._register('set_manager', lambda: SetManager(self.get_maya_scene()))
+        self._register('config_repository', JsonConfigRepository)
+        self._register('path_resolver', lambda: ConfigPathResolver(self.get_maya_scene()))
         
-        # Create data manager
-        data_manager = DataManager(
-            maya_scene=maya_scene,
-            set_manager=set_manager,
-            config_repository=config_repository,
-            path_resolver=path_resolver
-        )
-        self._instances['data_manager'] = data_manager
+        # Data manager
+        self._register('data_manager', lambda: DataManager(
+            maya_scene=self.get_maya_scene(),
+            set_manager=self.get_set_manager(),
+            config_repository=self.get_config_repository(),
+            path_resolver=self.get_path_resolver()
+        ))
         
-        # Create exporters
-        fbx_exporter = FBXExporter(maya_scene)
-        self._instances['fbx_exporter'] = fbx_exporter
+        # Exporters
+        self._register('fbx_exporter', lambda: FBXExporter(self.get_maya_scene()))
+        self._register('export_service', lambda: ExportService(self.get_fbx_exporter()))
         
-        export_service = ExportService(fbx_exporter)
-        self._instances['export_service'] = export_service
+        # Event bus
+        self._register('event_bus', EventBus)
+    
+    def _register(self, key: str, provider: Callable[[], Any], singleton: bool = True) -> None:
+        """
+        Register a provider for a dependency.
         
-        # Create event bus
-        event_bus = EventBus()
-        self._instances['event_bus'] = event_bus
+        Args:
+            key: Dependency name
+            provider: Callable that builds the dependency
+            singleton: If True, the first built instance is reused
+        """
+        self._providers[key] = (provider, singleton)
+    
+    def _resolve(self, key: str) -> Any:
+        """
+        Get a dependency, building it on first access.
         
-        self._initialized = True
-        logger.info("Dependency container initialized")
+        Args:
+            key: Dependency name
+            
+        Returns:
+            Dependency instance
+        """
+        self._ensure_initialized()
+        instance = self._instances.get(key)
+        if instance is None:
+            provider, singleton = self._providers[key]
+            instance = provider()
+            if singleton:
+                self._instances[key] = instance
+        return instance
     
     def get_maya_scene(self) -> MayaSceneInterface:
         """Get Maya scene interface."""
-        self._ensure_initialized()
-        return self._instances['maya_scene']
+        return self._resolve('maya_scene')
     
     def get_set_manager(self) -> SetManager:
         """Get set manager."""
-        self._ensure_initialized()
-        return self._instances['set_manager']
+        return self._resolve('set_manager')
     
     def get_config_repository(self) -> ConfigRepository:
         """Get config repository."""
-        self._ensure_initialized()
-        return self._instances['config_repository']
+        return self._resolve('config_repository')
     
     def get_path_resolver(self) -> ConfigPathResolver:
         """Get path resolver."""
-        self._ensure_initialized()
-        return self._instances['path_resolver']
+        return self._resolve('path_resolver')
     
     def get_data_manager(self) -> DataManager:
         """Get data manager."""
-        self._ensure_initialized()
-        return self._instances['data_manager']
+        return self._resolve('data_manager')
     
     def get_fbx_exporter(self) -> FBXExporter:
         """Get FBX exporter."""
-        self._ensure_initialized()
-        return self._instances['fbx_exporter']
+        return self._resolve('fbx_exporter')
     
     def get_export_service(self) -> ExportService:
         """Get export service."""
-        self._ensure_initialized()
-        return self._instances['export_service']
+        return self._resolve('export_service')
     
     def get_event_bus(self) -> EventBus:
         """Get event bus."""
-        self._ensure_initialized()
-        return self._instances['event_bus']
+        return self._resolve('event_bus')
     
     def _ensure_initialized(self) -> None:
         """Ensure container is initialized."""
@@ -116,12 +136,23 @@ class Container:
     def reset(self) -> None:
         """Reset the container (useful for testing)."""
         logger.info("Resetting dependency container")
+        
+        maya_scene = self._instances.get('maya_scene')
+        if maya_scene is not None:
+            maya_scene.remove_callbacks()
+        
+        data_manager = self._instances.get('data_manager')
+        if data_manager is not None:
+            data_manager.invalidate()
+        
         self._instances.clear()
+        self._providers.clear()
         self._initialized = False
 
 
 # Global container instance
 _container: Container = None
+_container_lock = threading.Lock()
 
 
 def get_container() -> Container:
@@ -133,15 +164,25 @@ def get_container() -> Container:
     """
     global _container
     if _container is None:
-        _container = Container()
-        _container.initialize()
+        with _container_lock:
+            if _container is None:
+                container = Container()
+                container.initialize()
+                _container = container
     return _container
 
 
-def reset_container() -> None:
-    """Reset the global container."""
+def reset_container(container: Optional[Container] = None) -> None:
+    """
+    Reset the global container, removing its Maya callbacks.
+    
+    Args:
+        container: If given, only reset when this is still the global container
+    """
     global _container
     if _container is not None:
-        _container.reset()
-    _container = None
+        with _container_lock:
+            if _container is not None and (container is None or _container is container):
+                _container.reset()
+                _container = None
 
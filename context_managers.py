@@ -3,7 +3,7 @@ Context Managers
 Reusable context managers for resource management.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from .maya_facade import MayaSceneInterface
 from .logger import get_logger
 
@@ -13,6 +13,8 @@ logger = get_logger(__name__)
 class MayaSelectionContext:
     """Context manager for saving and restoring Maya selection."""
     
+    __slots__ = ("maya_scene", "saved_selection", "_saved_tuple")
+    
     def __init__(self, maya_scene: MayaSceneInterface):
         """
         Initialize the selection context.
@@ -22,29 +24,38 @@ class MayaSelectionContext:
         """
         self.maya_scene = maya_scene
         self.saved_selection: Optional[List[str]] = None
+        self._saved_tuple: Tuple[str, ...] = ()
     
     def __enter__(self):
         """Save current selection."""
         self.saved_selection = self.maya_scene.get_selection()
-        logger.debug(f"Saved selection: {len(self.saved_selection)} objects")
+        self._saved_tuple = tuple(self.saved_selection or ())
+        logger.debug("Saved selection: %s objects", len(self.saved_selection))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restore saved selection."""
         try:
+            # Skip the select (and the viewport refresh it causes) if nothing changed
+            if tuple(self.maya_scene.get_selection()) == self._saved_tuple:
+                return False
+            
             if self.saved_selection:
-                self.maya_scene.select(self.saved_selection, replace=True)
+                # Restoring is bookkeeping, not a user action, so keep it off the undo queue
+                self.maya_scene.select(self.saved_selection, replace=True, undoable=False)
             else:
                 self.maya_scene.select(clear=True)
             logger.debug("Restored selection")
         except Exception as e:
-            logger.warning(f"Failed to restore selection: {e}")
+            logger.warning("Failed to restore selection: %s", e)
         return False
 
 
 class IsolationContext:
     """Context manager for viewport isolation."""
     
+    __slots__ = ("maya_scene", "panel", "was_isolated")
+    
     def __init__(self, maya_scene: MayaSceneInterface, panel: str):
         """
         Initialize the isolation context.
@@ -63,9 +74,9 @@ class IsolationContext:
             self.was_isolated = self.maya_scene.isolate_select(
                 self.panel, query=True
             ) or False
-            logger.debug(f"Saved isolation state for {self.panel}: {self.was_isolated}")
+            logger.debug("Saved isolation state for %s: %s", self.panel, self.was_isolated)
         except Exception as e:
-            logger.warning(f"Could not query isolation state: {e}")
+            logger.warning("Could not query isolation state: %s", e)
             self.was_isolated = False
         return self
     
@@ -74,15 +85,100 @@ class IsolationContext:
         try:
             if not self.was_isolated:
                 self.maya_scene.isolate_select(self.panel, state=False)
-                logger.debug(f"Restored isolation state for {self.panel}")
+                logger.debug("Restored isolation state for %s", self.panel)
+        except Exception as e:
+            logger.warning("Failed to restore isolation state: %s", e)
+        return False
+
+
+class BatchMayaOperation:
+    """
+    Context manager for batches of Maya mutations.
+    Suspends viewport refresh and, by default, groups the batch into a single undo chunk.
+    """
+    
+    __slots__ = ("maya_scene", "name", "disable_evaluation", "undo_chunk", "saved_evaluation_mode")
+    
+    # Nesting depth; only the outermost batch touches Maya state
+    _active_depth = 0
+    
+    def __init__(self, maya_scene: MayaSceneInterface,
+                 name: str = "batchExporterOperation",
+                 disable_evaluation: bool = False,
+                 undo_chunk: bool = True):
+        """
+        Initialize the batch operation context.
+        
+        Args:
+            maya_scene: Maya scene interface
+            name: Name of the undo chunk
+            disable_evaluation: If True, also switch the evaluation manager off
+            undo_chunk: If False, don't open an undo chunk (for batches that
+                make no undoable scene edits)
+        """
+        self.maya_scene = maya_scene
+        self.name = name
+        self.disable_evaluation = disable_evaluation
+        self.undo_chunk = undo_chunk
+        self.saved_evaluation_mode: Optional[str] = None
+    
+    def __enter__(self):
+        """Suspend refresh and open the undo chunk."""
+        BatchMayaOperation._active_depth += 1
+        if BatchMayaOperation._active_depth > 1:
+            return self
+        
+        try:
+            self.maya_scene.suspend_refresh(True)
         except Exception as e:
-            logger.warning(f"Failed to restore isolation state: {e}")
+            logger.warning("Could not suspend viewport refresh: %s", e)
+        
+        if self.undo_chunk:
+            try:
+                self.maya_scene.open_undo_chunk(self.name)
+            except Exception as e:
+                logger.warning("Could not open undo chunk: %s", e)
+        
+        if self.disable_evaluation:
+            try:
+                self.saved_evaluation_mode = self.maya_scene.get_evaluation_mode()
+                if self.saved_evaluation_mode != "off":
+                    self.maya_scene.set_evaluation_mode("off")
+            except Exception as e:
+                logger.warning("Could not switch evaluation manager off: %s", e)
+                self.saved_evaluation_mode = None
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Restore evaluation mode, close the undo chunk and resume refresh."""
+        BatchMayaOperation._active_depth -= 1
+        if BatchMayaOperation._active_depth > 0:
+            return False
+        
+        if self.saved_evaluation_mode and self.saved_evaluation_mode != "off":
+            try:
+                self.maya_scene.set_evaluation_mode(self.saved_evaluation_mode)
+            except Exception as e:
+                logger.warning("Failed to restore evaluation mode: %s", e)
+        
+        if self.undo_chunk:
+            try:
+                self.maya_scene.close_undo_chunk()
+            except Exception as e:
+                logger.warning("Failed to close undo chunk: %s", e)
+        
+        try:
+            self.maya_scene.suspend_refresh(False)
+        except Exception as e:
+            logger.warning("Failed to resume viewport refresh: %s", e)
         return False
 
 
 class PausedTimerContext:
     """Context manager for pausing and resuming a QTimer."""
     
+    __slots__ = ("timer", "was_active")
+    
     def __init__(self, timer):
         """
         Initialize the timer context.
@@ -3,16 +3,15 @@ Data Manager (Refactored)
 Orchestrates export group operations using composition.
 """
 
-from typing import List, Optional
-from .types import ExportGroupDict, FBXSettingsDict, ExportDataDict
+import os
+from typing import ContextManager, Dict, List, Optional, Tuple
+from .types import ExportGroup, FBXSettingsDict, ExportDataDict
 from .maya_facade import MayaSceneInterface
 from .set_manager import SetManager
 from .persistence import ConfigRepository, ConfigPathResolver
 from .validators import NameValidator
-from .constants import (
-    DEFAULT_UP_AXIS, DEFAULT_TRIANGULATE, DEFAULT_CONVERT_UNIT,
-    DEFAULT_EXPORT_DIRECTORY, DEFAULT_FILE_PREFIX, SET_PREFIX
-)
+from .context_managers import BatchMayaOperation
+from .constants import DEFAULT_FBX_SETTINGS, SET_PREFIX, SET_PREFIX_LEN
 from .exceptions import ValidationError
 from .logger import get_logger
 
@@ -50,61 +49,125 @@ class DataManager:
             "expanded_groups": []
         }
         self.group_order: List[str] = []  # Track desired order by set_name
+        self._index_by_setname: Dict[str, int] = {}  # set_name -> index in export_groups
+        
+        # Cached group data is reused until a mutation or a set change in the scene
+        self._dirty = True
+        self._sync_generation: int = -1
+        
+        # Hash of the last content written by save_to_file (includes the path)
+        self._last_saved_hash: Optional[int] = None
     
     def _get_default_fbx_settings(self) -> FBXSettingsDict:
         """Get default FBX settings."""
-        return {
-            "up_axis": DEFAULT_UP_AXIS,
-            "triangulate": DEFAULT_TRIANGULATE,
-            "convert_unit": DEFAULT_CONVERT_UNIT,
-            "export_directory": DEFAULT_EXPORT_DIRECTORY,
-            "file_prefix": DEFAULT_FILE_PREFIX,
-        }
+        return dict(DEFAULT_FBX_SETTINGS)
+    
+    def invalidate(self) -> None:
+        """Mark cached group data as stale so the next access resyncs from the scene."""
+        self._dirty = True
+    
+    def _is_synced(self) -> bool:
+        """Check whether the cached group data still matches the scene."""
+        return not self._dirty and self.maya_scene.get_set_generation() == self._sync_generation
+    
+    def _sync_if_dirty(self) -> None:
+        """Synchronize from the scene only if the cached group data is stale."""
+        if not self._is_synced():
+            self.sync_from_scene()
+    
+    def _register_new_group(self, set_name: str, was_synced: bool) -> int:
+        """
+        Record a set created by this manager and return its group index.
+        
+        If the cache was current before the set was created, the group is
+        appended directly instead of resyncing the whole scene.
+        
+        Args:
+            set_name: Name of the newly created set
+            was_synced: Whether the cache was current before the set was created
+            
+        Returns:
+            Index of the new group
+        """
+        if not was_synced:
+            self.sync_from_scene()
+            index = self._index_by_setname.get(set_name)
+            return index if index is not None else len(self.data["export_groups"]) - 1
+        
+        group = ExportGroup(name=set_name[SET_PREFIX_LEN:], set_name=set_name)
+        self.data["export_groups"].append(group)
+        self.group_order.append(set_name)
+        index = len(self.data["export_groups"]) - 1
+        self._index_by_setname[set_name] = index
+        
+        # Absorb the set-added notification caused by our own creation
+        self._sync_generation = self.maya_scene.get_set_generation()
+        self._dirty = False
+        return index
     
     def sync_from_scene(self) -> None:
         """Synchronize data structure from Maya sets in the scene."""
         try:
+            generation = self.maya_scene.get_set_generation()
+            # Cached per set generation, so an unchanged scene costs no Maya query
             export_sets = self.set_manager.list_export_sets()
             
             # Build groups from sets
-            groups_dict = {}
-            for set_name in export_sets:
-                if self.maya_scene.object_exists(set_name):
-                    display_name = set_name[len(SET_PREFIX):]
-                    group: ExportGroupDict = {
-                        "name": display_name,
-                        "set_name": set_name
-                    }
-                    groups_dict[set_name] = group
-            
-            # Update group_order to include any new sets
-            for set_name in groups_dict:
-                if set_name not in self.group_order:
-                    self.group_order.append(set_name)
-            
-            # Remove deleted sets from order
+            prefix = SET_PREFIX
+            groups_dict = {
+                set_name: ExportGroup(name=set_name.removeprefix(prefix), set_name=set_name)
+                for set_name in export_sets
+            }
+            
+            # Remove deleted sets from order, then append any new sets
             self.group_order = [s for s in self.group_order if s in groups_dict]
+            known = set(self.group_order)
+            self.group_order.extend(s for s in groups_dict if s not in known)
             
             # Build final list in the correct order
-            self.data["export_groups"] = []
-            for set_name in self.group_order:
-                if set_name in groups_dict:
-                    self.data["export_groups"].append(groups_dict[set_name])
+            self.data["export_groups"] = [groups_dict[s] for s in self.group_order]
             
-            logger.debug(f"Synced {len(self.data['export_groups'])} groups from scene")
+            self._index_by_setname = {s: i for i, s in enumerate(self.group_order)}
+            self._sync_generation = generation
+            self._dirty = False
+            logger.debug("Synced %s groups from scene", len(self.data['export_groups']))
         except Exception as e:
-            logger.error(f"Error syncing data from scene: {e}")
+            logger.error("Error syncing data from scene: %s", e)
     
     def get_json_path(self) -> str:
         """Get the default JSON file path based on current Maya scene."""
         return self.path_resolver.get_default_config_path()
     
-    def save_to_file(self, file_path: Optional[str] = None) -> tuple[bool, str]:
+    def _content_hash(self, file_path: str, group_rows: Tuple[Tuple[str, str], ...]) -> Optional[int]:
+        """
+        Hash the content save_to_file would write to a path.
+        
+        Args:
+            file_path: Target file path
+            group_rows: (name, set_name) pair for each export group
+            
+        Returns:
+            Hash of the path, groups, FBX settings and expanded groups, or None
+            if a loaded file left unhashable values in the settings
+        """
+        try:
+            return hash((
+                file_path,
+                group_rows,
+                tuple(sorted(self.data["fbx_settings"].items())),
+                tuple(self.data.get("expanded_groups", [])),
+            ))
+        except TypeError:
+            return None
+    
+    def save_to_file(self, file_path: Optional[str] = None,
+                     force_sync: bool = False) -> tuple[bool, str]:
         """
         Save export groups and settings to JSON file.
         
         Args:
             file_path: Optional custom file path
+            force_sync: If True, resync from the scene even if the cache is current
             
         Returns:
             Tuple of (success, message)
@@ -112,13 +175,33 @@ class DataManager:
         if file_path is None:
             file_path = self.get_json_path()
         
-        self.sync_from_scene()
+        if force_sync:
+            self.sync_from_scene()
+        else:
+            self._sync_if_dirty()
         
         try:
-            self.config_repository.save(self.data, file_path)
+            # One pass over the groups feeds both the change check and the output
+            group_rows = tuple((g.name, g.set_name) for g in self.data["export_groups"])
+            
+            # Skip the write if this exact content is already on disk; content
+            # that can't be hashed is always written
+            content_hash = self._content_hash(file_path, group_rows)
+            if (content_hash is not None and content_hash == self._last_saved_hash
+                    and os.path.exists(file_path)):
+                logger.debug("Configuration unchanged, skipped writing: %s", file_path)
+                return True, file_path
+            
+            # Groups are dataclasses in memory; the file keeps the dict schema
+            data = dict(self.data)
+            data["export_groups"] = [
+                {"name": name, "set_name": set_name} for name, set_name in group_rows
+            ]
+            self.config_repository.save(data, file_path)
+            self._last_saved_hash = content_hash
             return True, file_path
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
             return False, str(e)
     
     def load_from_file(self, file_path: Optional[str] = None) -> tuple[bool, str]:
@@ -134,45 +217,62 @@ class DataManager:
         if file_path is None:
             file_path = self.get_json_path()
         
-        if not self.config_repository.exists(file_path):
-            return False, "File does not exist"
-        
         try:
             loaded_data = self.config_repository.load(file_path)
             
-            # Update FBX settings
-            self.data["fbx_settings"] = loaded_data["fbx_settings"]
-            
-            # Create sets from loaded data
-            self._create_sets_from_data(loaded_data.get("export_groups", []))
-            
-            # Sync to get current state
-            self.sync_from_scene()
+            with BatchMayaOperation(self.maya_scene, name="batchExporterLoad"):
+                # Update FBX settings
+                self.data["fbx_settings"] = loaded_data["fbx_settings"]
+                
+                # Create sets from loaded data
+                self._create_sets_from_data(
+                    [ExportGroup.from_dict(g) for g in loaded_data.get("export_groups", [])]
+                )
+                
+                # Sync to get current state
+                self._dirty = True
+                self._sync_if_dirty()
             
             return True, file_path
+        except FileNotFoundError:
+            return False, "File does not exist"
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             return False, str(e)
     
-    def _create_sets_from_data(self, groups_data: List[ExportGroupDict]) -> None:
+    def _create_sets_from_data(self, groups_data: List[ExportGroup]) -> None:
         """
         Create or update Maya sets from loaded JSON data.
         
         Args:
             groups_data: List of export group data
         """
-        for group_data in groups_data:
-            set_name = group_data.get("set_name")
-            display_name = group_data.get("name", "untitled")
-            
-            if not set_name:
-                set_name = self.set_manager.get_unique_set_name(display_name)
-            
-            if not self.maya_scene.object_exists(set_name):
+        # One batched lookup for all saved set names instead of an objExists per group
+        existing = self.maya_scene.existing_objects(
+            [g.set_name for g in groups_data if g.set_name]
+        )
+        
+        with BatchMayaOperation(self.maya_scene, name="batchExporterCreateSets"):
+            for group_data in groups_data:
+                set_name = group_data.set_name
+                display_name = group_data.name
+                
+                if set_name and set_name in existing:
+                    continue
+                
                 try:
-                    self.set_manager.create_set(display_name)
+                    existing.add(self.set_manager.create_set(display_name))
                 except Exception as e:
-                    logger.warning(f"Failed to create set for '{display_name}': {e}")
+                    logger.warning("Failed to create set for '%s': %s", display_name, e)
+    
+    def batch(self) -> ContextManager[None]:
+        """
+        Group several set operations so existence checks share one scene query.
+        
+        Returns:
+            Context manager wrapping the bulk operation
+        """
+        return self.set_manager.batch()
     
     def add_export_group(self, name: str) -> Optional[int]:
         """
@@ -189,21 +289,15 @@ class DataManager:
             name = NameValidator.validate_group_name(name)
             
             # Create set
+            was_synced = self._is_synced()
             set_name = self.set_manager.create_set(name)
             
-            # Sync and find index
-            self.sync_from_scene()
-            
-            for i, group in enumerate(self.data["export_groups"]):
-                if group["set_name"] == set_name:
-                    return i
-            
-            return len(self.data["export_groups"]) - 1
+            return self._register_new_group(set_name, was_synced)
         except ValidationError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Failed to add export group: {e}")
+            logger.error("Failed to add export group: %s", e)
             return None
     
     def remove_export_group(self, index: int) -> bool:
@@ -218,16 +312,17 @@ class DataManager:
         """
         if 0 <= index < len(self.data["export_groups"]):
             group = self.data["export_groups"][index]
-            set_name = group.get("set_name")
+            set_name = group.set_name
             
             if set_name:
                 try:
                     self.set_manager.delete_set(set_name)
                 except Exception as e:
-                    logger.error(f"Failed to delete set: {e}")
+                    logger.error("Failed to delete set: %s", e)
                     return False
             
-            self.sync_from_scene()
+            self._dirty = True
+            self._sync_if_dirty()
             return True
         return False
     
@@ -244,7 +339,7 @@ class DataManager:
         """
         if 0 <= index < len(self.data["export_groups"]):
             group = self.data["export_groups"][index]
-            set_name = group.get("set_name")
+            set_name = group.set_name
             
             if not set_name or not self.maya_scene.object_exists(set_name):
                 return False
@@ -254,20 +349,25 @@ class DataManager:
                     # Validate name
                     name = NameValidator.validate_group_name(name)
                     
+                    # Unchanged name: nothing to rename, cache stays valid
+                    if name == set_name[SET_PREFIX_LEN:]:
+                        return True
+                    
                     # Rename set
                     self.set_manager.rename_set(set_name, name)
                 except ValidationError as e:
-                    logger.error(f"Validation error: {e}")
+                    logger.error("Validation error: %s", e)
                     return False
                 except Exception as e:
-                    logger.error(f"Failed to rename group: {e}")
+                    logger.error("Failed to rename group: %s", e)
                     return False
             
-            self.sync_from_scene()
+            self._dirty = True
+            self._sync_if_dirty()
             return True
         return False
     
-    def get_export_group(self, index: int) -> Optional[ExportGroupDict]:
+    def get_export_group(self, index: int) -> Optional[ExportGroup]:
         """
         Get an export group by index.
         
@@ -277,19 +377,57 @@ class DataManager:
         Returns:
             Export group data, or None if not found
         """
-        self.sync_from_scene()
+        self._sync_if_dirty()
         if 0 <= index < len(self.data["export_groups"]):
             return self.data["export_groups"][index]
         return None
     
-    def get_all_export_groups(self) -> List[ExportGroupDict]:
+    def get_set_name(self, index: int) -> Optional[str]:
+        """
+        Get the set name of an export group by index.
+        
+        Args:
+            index: Index of the group
+            
+        Returns:
+            Maya set name, or None if not found
+        """
+        self._sync_if_dirty()
+        if 0 <= index < len(self.group_order):
+            return self.group_order[index]
+        return None
+    
+    def get_all_set_names(self) -> List[str]:
+        """
+        Get the set names of all export groups, in group order.
+        
+        Returns:
+            List of Maya set names
+        """
+        self._sync_if_dirty()
+        return list(self.group_order)
+    
+    def find_group_index(self, set_name: str) -> Optional[int]:
+        """
+        Get the index of an export group by its set name.
+        
+        Args:
+            set_name: Maya set name of the group
+            
+        Returns:
+            Index of the group, or None if not found
+        """
+        self._sync_if_dirty()
+        return self._index_by_setname.get(set_name)
+    
+    def get_all_export_groups(self) -> List[ExportGroup]:
         """
         Get all export groups.
         
         Returns:
             List of export group data
         """
-        self.sync_from_scene()
+        self._sync_if_dirty()
         return self.data["export_groups"]
     
     def get_set_objects(self, set_name: str) -> List[str]:
@@ -305,9 +443,25 @@ class DataManager:
         try:
             return self.set_manager.get_set_objects(set_name)
         except Exception as e:
-            logger.error(f"Failed to get set objects: {e}")
+            logger.error("Failed to get set objects: %s", e)
             return []
     
+    def get_set_objects_many(self, set_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Get objects in several Maya sets at once.
+        
+        Args:
+            set_names: Names of the sets
+            
+        Returns:
+            Object names keyed by set name; sets that don't exist are omitted
+        """
+        try:
+            return self.set_manager.get_set_objects_many(set_names)
+        except Exception as e:
+            logger.error("Failed to get set objects: %s", e)
+            return {}
+    
     def add_objects_to_set(self, set_name: str, objects: List[str]) -> bool:
         """
         Add objects to a Maya set.
@@ -323,7 +477,7 @@ class DataManager:
             self.set_manager.add_objects_to_set(set_name, objects)
             return True
         except Exception as e:
-            logger.error(f"Failed to add objects to set: {e}")
+            logger.error("Failed to add objects to set: %s", e)
             return False
     
     def remove_objects_from_set(self, set_name: str, objects: List[str]) -> bool:
@@ -341,7 +495,7 @@ class DataManager:
             self.set_manager.remove_objects_from_set(set_name, objects)
             return True
         except Exception as e:
-            logger.error(f"Failed to remove objects from set: {e}")
+            logger.error("Failed to remove objects from set: %s", e)
             return False
     
     def clear_set(self, set_name: str) -> bool:
@@ -358,7 +512,7 @@ class DataManager:
             self.set_manager.clear_set(set_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to clear set: {e}")
+            logger.error("Failed to clear set: %s", e)
             return False
     
     def duplicate_export_group(self, index: int) -> Optional[int]:
@@ -373,28 +527,37 @@ class DataManager:
         """
         if 0 <= index < len(self.data["export_groups"]):
             original = self.data["export_groups"][index]
-            original_set = original.get("set_name")
+            original_set = original.set_name
             
             if not original_set or not self.maya_scene.object_exists(original_set):
                 return None
             
             try:
-                new_name = original["name"] + "_copy"
+                new_name = original.name + "_copy"
+                was_synced = self._is_synced()
                 new_set_name = self.set_manager.duplicate_set(original_set, new_name)
                 
-                self.sync_from_scene()
-                
-                # Find new group index
-                for i, group in enumerate(self.data["export_groups"]):
-                    if group["set_name"] == new_set_name:
-                        return i
-                
-                return len(self.data["export_groups"]) - 1
+                return self._register_new_group(new_set_name, was_synced)
             except Exception as e:
-                logger.error(f"Failed to duplicate group: {e}")
+                logger.error("Failed to duplicate group: %s", e)
                 return None
         return None
     
+    def _swap_groups(self, first: int, second: int) -> None:
+        """
+        Swap two groups in the cached order without touching the scene.
+        
+        Args:
+            first: Index of the first group
+            second: Index of the second group
+        """
+        order = self.group_order
+        groups = self.data["export_groups"]
+        order[first], order[second] = order[second], order[first]
+        groups[first], groups[second] = groups[second], groups[first]
+        self._index_by_setname[order[first]] = first
+        self._index_by_setname[order[second]] = second
+    
     def move_group_up(self, index: int) -> bool:
         """
         Move a group up in the list.
@@ -405,16 +568,12 @@ class DataManager:
         Returns:
             True if successful
         """
+        self._sync_if_dirty()
         if index <= 0 or index >= len(self.group_order):
             return False
         
-        # Swap in order list
-        self.group_order[index], self.group_order[index - 1] = \
-            self.group_order[index - 1], self.group_order[index]
-        
-        # Resync to apply new order
-        self.sync_from_scene()
-        logger.info(f"Moved group up to index {index - 1}")
+        self._swap_groups(index, index - 1)
+        logger.info("Moved group up to index %s", index - 1)
         return True
     
     def move_group_down(self, index: int) -> bool:
@@ -427,16 +586,12 @@ class DataManager:
         Returns:
             True if successful
         """
+        self._sync_if_dirty()
         if index < 0 or index >= len(self.group_order) - 1:
             return False
         
-        # Swap in order list
-        self.group_order[index], self.group_order[index + 1] = \
-            self.group_order[index + 1], self.group_order[index]
-        
-        # Resync to apply new order
-        self.sync_from_scene()
-        logger.info(f"Moved group down to index {index + 1}")
+        self._swap_groups(index, index + 1)
+        logger.info("Moved group down to index %s", index + 1)
         return True
     
     def update_fbx_settings(self, settings: dict) -> None:
@@ -3,84 +3,121 @@ Event System
 Observer pattern implementation for decoupled UI updates.
 """
 
-from typing import Callable, Dict, List, Any
+import inspect
+import weakref
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Event:
     """Base class for all events."""
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(frozen=True)
 class GroupAddedEvent(Event):
     """Fired when a new group is added."""
+    __slots__ = ("group_index", "group_name")
+    
     group_index: int
     group_name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class GroupRemovedEvent(Event):
     """Fired when a group is removed."""
+    __slots__ = ("group_name",)
+    
     group_name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class GroupUpdatedEvent(Event):
     """Fired when a group is updated."""
+    __slots__ = ("group_index", "group_name")
+    
     group_index: int
     group_name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class GroupDuplicatedEvent(Event):
     """Fired when a group is duplicated."""
+    __slots__ = ("original_index", "new_index")
+    
     original_index: int
     new_index: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class ObjectsAddedToGroupEvent(Event):
     """Fired when objects are added to a group."""
+    __slots__ = ("group_index", "object_count")
+    
     group_index: int
     object_count: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class ObjectsRemovedFromGroupEvent(Event):
     """Fired when objects are removed from a group."""
+    __slots__ = ("group_index", "object_count")
+    
     group_index: int
     object_count: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExportCompletedEvent(Event):
     """Fired when an export completes."""
+    __slots__ = ("success", "group_name", "message")
+    
     success: bool
     group_name: str
     message: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class SettingsChangedEvent(Event):
     """Fired when export settings change."""
+    __slots__ = ("setting_name", "new_value")
+    
     setting_name: str
     new_value: Any
 
 
+def _make_ref(callback: Callable[[Event], None]) -> Callable[[], Optional[Callable]]:
+    """
+    Wrap a subscriber so the bus does not keep its owner alive.
+    
+    Bound methods are held weakly; plain functions and lambdas are held
+    strongly since they usually have no other owner.
+    
+    Args:
+        callback: Subscriber callback
+        
+    Returns:
+        Callable returning the callback, or None once its owner is gone
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
 class EventBus:
     """
     Event bus for pub-sub messaging.
     Allows decoupled communication between components.
+    Subscribed bound methods are dropped automatically when their object is collected.
     """
     
     def __init__(self):
         """Initialize the event bus."""
-        self._subscribers: Dict[type, List[Callable]] = {}
+        self._subscribers: Dict[type, List[Callable[[], Optional[Callable]]]] = {}
     
     def subscribe(self, event_type: type, callback: Callable[[Event], None]) -> None:
         """
@@ -93,8 +130,8 @@ class EventBus:
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
         
-        self._subscribers[event_type].append(callback)
-        logger.debug(f"Subscribed to {event_type.__name__}")
+        self._subscribers[event_type].append(_make_ref(callback))
+        logger.debug("Subscribed to %s", event_type.__name__)
     
     def unsubscribe(self, event_type: type, callback: Callable[[Event], None]) -> None:
         """
@@ -104,12 +141,12 @@ class EventBus:
             event_type: Type of event to unsubscribe from
             callback: Function to remove
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-                logger.debug(f"Unsubscribed from {event_type.__name__}")
-            except ValueError:
-                pass
+        subscribers = self._subscribers.get(event_type)
+        if subscribers:
+            remaining = [ref for ref in subscribers if ref() != callback]
+            if len(remaining) != len(subscribers):
+                subscribers[:] = remaining
+                logger.debug("Unsubscribed from %s", event_type.__name__)
     
     def publish(self, event: Event) -> None:
         """
@@ -119,17 +156,26 @@ class EventBus:
             event: Event to publish
         """
         event_type = type(event)
-        
-        if event_type not in self._subscribers:
+        subscribers = self._subscribers.get(event_type)
+        if not subscribers:
             return
         
-        logger.debug(f"Publishing {event_type.__name__}")
+        logger.debug("Publishing %s", event_type.__name__)
         
-        for callback in self._subscribers[event_type]:
+        # Iterate a snapshot so callbacks can (un)subscribe while dispatching
+        found_dead = False
+        for ref in tuple(subscribers):
+            callback = ref()
+            if callback is None:
+                found_dead = True
+                continue
             try:
                 callback(event)
             except Exception as e:
-                logger.error(f"Error in event subscriber: {e}")
+                logger.error("Error in event subscriber: %s", e)
+        
+        if found_dead:
+            subscribers[:] = [ref for ref in subscribers if ref() is not None]
     
     def clear_all(self) -> None:
         """Clear all subscribers."""
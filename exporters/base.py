@@ -4,12 +4,13 @@ Abstract interfaces for exporters.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
-from ..types import ExportGroupDict, FBXSettingsDict
+from typing import Any, Dict, List
+from ..types import ExportGroup, FBXSettingsDict
 
 
 class ExportSettings(ABC):
     """Abstract base class for export settings."""
+    __slots__ = ()
     
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -36,7 +37,7 @@ class Exporter(ABC):
     """Abstract base class for exporters."""
     
     @abstractmethod
-    def export_group(self, group: ExportGroupDict, settings: Dict[str, Any]) -> tuple[bool, str]:
+    def export_group(self, group: ExportGroup, settings: Dict[str, Any]) -> tuple[bool, str]:
         """
         Export a single group.
         
@@ -49,6 +50,21 @@ class Exporter(ABC):
         """
         pass
     
+    def export_groups(self, groups: List[ExportGroup], settings: Dict[str, Any]) -> List[tuple[bool, str]]:
+        """
+        Export several groups with the same settings.
+        
+        Exporters can override this to do per-batch work once instead of per group.
+        
+        Args:
+            groups: Export groups to export
+            settings: Export settings
+            
+        Returns:
+            (success, message) tuple for each group, in input order
+        """
+        return [self.export_group(group, settings) for group in groups]
+    
     @abstractmethod
     def apply_settings(self, settings: Dict[str, Any]) -> bool:
         """
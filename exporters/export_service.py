@@ -5,7 +5,7 @@ Coordinates export operations with progress tracking and error handling.
 
 from typing import List, Dict, Any
 from .base import Exporter
-from ..types import ExportGroupDict, ExportResultDict
+from ..types import ExportGroup, ExportResult
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,7 +23,7 @@ class ExportService:
         """
         self.exporter = exporter
     
-    def export_single_group(self, group: ExportGroupDict, settings: Dict[str, Any]) -> ExportResultDict:
+    def export_single_group(self, group: ExportGroup, settings: Dict[str, Any]) -> ExportResult:
         """
         Export a single group.
         
@@ -32,22 +32,16 @@ class ExportService:
             settings: Export settings
             
         Returns:
-            Export result dictionary
+            Export result
         """
-        group_name = group.get("name", "untitled")
-        logger.info(f"Starting export of group: {group_name}")
+        group_name = group.name
+        logger.info("Starting export of group: %s", group_name)
         
         success, message = self.exporter.export_group(group, settings)
         
-        result: ExportResultDict = {
-            "group_name": group_name,
-            "success": success,
-            "message": message
-        }
-        
-        return result
+        return ExportResult(group_name, success, message)
     
-    def export_all_groups(self, groups: List[ExportGroupDict], settings: Dict[str, Any]) -> tuple[List[ExportResultDict], int]:
+    def export_all_groups(self, groups: List[ExportGroup], settings: Dict[str, Any]) -> tuple[List[ExportResult], int]:
         """
         Export all groups.
         
@@ -58,22 +52,24 @@ class ExportService:
         Returns:
             Tuple of (results list, success count)
         """
-        results: List[ExportResultDict] = []
-        success_count = 0
+        logger.info("Starting batch export of %d groups", len(groups))
         
-        logger.info(f"Starting batch export of {len(groups)} groups")
+        # The exporter runs the whole batch so per-batch setup happens once
+        outcomes = self.exporter.export_groups(groups, settings)
         
-        for i, group in enumerate(groups):
-            group_name = group.get("name", f"Group {i}")
-            logger.info(f"Exporting group {i+1}/{len(groups)}: {group_name}")
-            
-            result = self.export_single_group(group, settings)
-            results.append(result)
-            
-            if result["success"]:
-                success_count += 1
+        # Never let a short outcome list silently drop groups from the report
+        if len(outcomes) != len(groups):
+            logger.error("Exporter returned %d results for %d groups", len(outcomes), len(groups))
+            missing = (False, "Exporter returned no result for this group")
+            outcomes = list(outcomes[:len(groups)]) + [missing] * (len(groups) - len(outcomes))
+        
+        results = [
+            ExportResult(group.name, success, message)
+            for group, (success, message) in zip(groups, outcomes)
+        ]
+        success_count = sum(1 for result in results if result.success)
         
-        logger.info(f"Batch export complete: {success_count}/{len(groups)} successful")
+        logger.info("Batch export complete: %d/%d successful", success_count, len(groups))
         
         return results, success_count
 
@@ -4,33 +4,48 @@ Handles FBX export operations using Maya API facade.
 """
 
 import os
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
 from .base import Exporter, ExportSettings
-from ..types import ExportGroupDict, FBXSettingsDict
+from ..types import ExportGroup, FBXSettingsDict
 from ..maya_facade import MayaSceneInterface
+from ..context_managers import BatchMayaOperation, MayaSelectionContext
 from ..exceptions import ExportError, PluginError, ValidationError
-from ..validators import PathValidator
 from ..constants import FBX_EXTENSION
 from ..logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
 class FBXSettings(ExportSettings):
     """FBX export settings."""
+    __slots__ = ("up_axis", "triangulate", "convert_unit", "export_directory", "file_prefix")
     
-    def __init__(self, settings_dict: FBXSettingsDict):
+    up_axis: str
+    triangulate: bool
+    convert_unit: str
+    export_directory: str
+    file_prefix: str
+    
+    @classmethod
+    def from_dict(cls, settings_dict: FBXSettingsDict) -> "FBXSettings":
         """
-        Initialize FBX settings.
+        Build FBX settings from a settings dictionary.
         
         Args:
             settings_dict: Settings dictionary
+            
+        Returns:
+            FBX settings, with defaults for missing keys
         """
-        self.up_axis = settings_dict.get("up_axis", "Y")
-        self.triangulate = settings_dict.get("triangulate", False)
-        self.convert_unit = settings_dict.get("convert_unit", "cm")
-        self.export_directory = settings_dict.get("export_directory", "")
-        self.file_prefix = settings_dict.get("file_prefix", "")
+        return cls(
+            up_axis=settings_dict.get("up_axis", "Y"),
+            triangulate=settings_dict.get("triangulate", False),
+            convert_unit=settings_dict.get("convert_unit", "cm"),
+            export_directory=settings_dict.get("export_directory", ""),
+            file_prefix=settings_dict.get("file_prefix", ""),
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary."""
@@ -73,12 +88,16 @@ class FBXExporter(Exporter):
             maya_scene: Maya scene interface
         """
         self.maya_scene = maya_scene
-        self._ensure_plugin_loaded()
+        # Set while a batch runs: settings were pushed to the plugin once up front
+        self._settings_applied = False
     
     def _ensure_plugin_loaded(self) -> None:
         """
         Ensure FBX plugin is loaded.
         
+        The check runs on every call so an unloaded plugin is picked up again;
+        the adapter caches the answer until a plugin load or unload.
+        
         Raises:
             PluginError: If plugin cannot be loaded
         """
@@ -86,12 +105,12 @@ class FBXExporter(Exporter):
             if not self.maya_scene.is_plugin_loaded("fbxmaya"):
                 self.maya_scene.load_plugin("fbxmaya")
                 logger.info("Loaded FBX plugin")
-        except Exception as e:
+        except RuntimeError as e:
             raise PluginError(f"Could not load FBX plugin: {e}")
     
     def apply_settings(self, settings: Dict[str, Any]) -> bool:
         """
-        Apply FBX export settings using MEL commands.
+        Apply FBX export settings through the FBX plugin commands.
         
         Args:
             settings: FBX settings dictionary
@@ -100,33 +119,51 @@ class FBXExporter(Exporter):
             True if successful
         """
         try:
-            fbx_settings = FBXSettings(settings)
-            fbx_settings.validate()
-            
-            # Reset to defaults first
-            self.maya_scene.eval_mel('FBXResetExport')
-            
-            # Apply up axis
-            self.maya_scene.eval_mel(f'FBXExportUpAxis {fbx_settings.up_axis}')
-            
-            # Apply triangulate
-            value = "true" if fbx_settings.triangulate else "false"
-            self.maya_scene.eval_mel(f'FBXExportTriangulate -v {value}')
-            
-            # Apply unit conversion
-            self.maya_scene.eval_mel(f'FBXExportConvertUnitString "{fbx_settings.convert_unit}"')
-            
-            logger.debug("Applied FBX settings")
+            fbx_settings = self._build_settings(settings)
+            self._ensure_plugin_loaded()
+            self._apply_fbx_settings(fbx_settings)
             return True
             
         except ValidationError as e:
-            logger.error(f"Invalid FBX settings: {e}")
+            logger.error("Invalid FBX settings: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Error applying FBX settings: {e}")
+            logger.error("Error applying FBX settings: %s", e)
             return False
     
-    def export_group(self, group: ExportGroupDict, settings: Dict[str, Any]) -> tuple[bool, str]:
+    def _apply_fbx_settings(self, fbx_settings: FBXSettings) -> None:
+        """
+        Push validated FBX settings to the FBX plugin.
+        
+        Args:
+            fbx_settings: Validated FBX settings
+        """
+        self.maya_scene.apply_fbx_export_settings(
+            fbx_settings.up_axis,
+            fbx_settings.triangulate,
+            fbx_settings.convert_unit,
+        )
+        logger.debug("Applied FBX settings")
+    
+    @staticmethod
+    def _build_settings(settings: Dict[str, Any]) -> FBXSettings:
+        """
+        Build and validate FBX settings from a settings dictionary.
+        
+        Args:
+            settings: FBX settings dictionary
+            
+        Returns:
+            Validated FBX settings
+            
+        Raises:
+            ValidationError: If settings are invalid
+        """
+        fbx_settings = FBXSettings.from_dict(settings)
+        fbx_settings.validate()
+        return fbx_settings
+    
+    def export_group(self, group: ExportGroup, settings: Dict[str, Any]) -> tuple[bool, str]:
         """
         Export a single group with the given FBX settings.
         
@@ -137,103 +174,201 @@ class FBXExporter(Exporter):
         Returns:
             Tuple of (success, message)
         """
-        name = group.get("name", "untitled")
-        set_name = group.get("set_name")
+        try:
+            fbx_settings = self._build_settings(settings)
+        except ValidationError as e:
+            msg = f"Invalid settings: {e}"
+            logger.error(msg)
+            return False, msg
         
         try:
-            # Validate settings
-            fbx_settings = FBXSettings(settings)
-            fbx_settings.validate()
+            self._ensure_plugin_loaded()
+        except PluginError as e:
+            msg = str(e)
+            logger.error(msg)
+            return False, msg
+        
+        return self._export_group(group, fbx_settings)
+    
+    def export_groups(self, groups: List[ExportGroup], settings: Dict[str, Any]) -> List[tuple[bool, str]]:
+        """
+        Export several groups, validating the settings once for the whole batch.
+        
+        Args:
+            groups: Export groups to export
+            settings: FBX settings dictionary
             
+        Returns:
+            (success, message) tuple for each group, in input order
+        """
+        try:
+            fbx_settings = self._build_settings(settings)
         except ValidationError as e:
             msg = f"Invalid settings: {e}"
             logger.error(msg)
+            return [(False, msg)] * len(groups)
+        
+        try:
+            self._ensure_plugin_loaded()
+        except PluginError as e:
+            msg = str(e)
+            logger.error(msg)
+            return [(False, msg)] * len(groups)
+        
+        # Settings are identical for every group, so push them to the plugin once
+        try:
+            self._apply_fbx_settings(fbx_settings)
+        except Exception as e:
+            msg = f"Failed to apply FBX settings: {e}"
+            logger.error(msg)
+            return [(False, msg)] * len(groups)
+        
+        # The directory is shared by every group, so resolve and create it once
+        try:
+            export_directory = self._prepare_export_directory(fbx_settings)
+        except ExportError as e:
+            msg = str(e)
+            logger.error(msg)
+            return [(False, msg)] * len(groups)
+        
+        # Directory and file prefix are shared, so join them once
+        path_prefix = os.path.join(export_directory, fbx_settings.file_prefix)
+        
+        # Resolve every set and its members up front instead of once per group
+        members_by_set = self.maya_scene.get_set_members_many(
+            [group.set_name for group in groups if group.set_name]
+        )
+        
+        self._settings_applied = True
+        try:
+            # Suspend viewport refresh so selection changes between groups
+            # don't trigger redraws. Evaluation is left alone (toggling it forces
+            # a graph rebuild) and no undo chunk is opened, since exporting
+            # edits nothing. The selection is saved and restored once for the whole batch
+            with BatchMayaOperation(self.maya_scene, "batchExporterExport",
+                                    undo_chunk=False), \
+                    MayaSelectionContext(self.maya_scene):
+                results: List[tuple[bool, str]] = []
+                for i, group in enumerate(groups, 1):
+                    logger.info("Exporting group %d/%d: %s", i, len(groups), group.name)
+                    results.append(self._export_members(
+                        group.name, members_by_set.get(group.set_name),
+                        path_prefix, fbx_settings
+                    ))
+            return results
+        finally:
+            self._settings_applied = False
+    
+    def _export_group(self, group: ExportGroup, fbx_settings: FBXSettings) -> tuple[bool, str]:
+        """
+        Export a single group with already validated settings.
+        
+        Args:
+            group: Export group data
+            fbx_settings: Validated FBX settings
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            export_directory = self._prepare_export_directory(fbx_settings)
+        except ExportError as e:
+            msg = str(e)
+            logger.error(msg)
             return False, msg
         
+        set_name = group.set_name
+        set_members = None
+        if set_name and self.maya_scene.object_exists(set_name):
+            set_members = self.maya_scene.get_set_members(set_name)
+        path_prefix = os.path.join(export_directory, fbx_settings.file_prefix)
+        with MayaSelectionContext(self.maya_scene):
+            return self._export_members(group.name, set_members, path_prefix, fbx_settings)
+    
+    def _prepare_export_directory(self, fbx_settings: FBXSettings) -> str:
+        """
+        Resolve the export directory and make sure it exists.
+        
+        Relative directories are resolved against the Maya scene file.
+        
+        Args:
+            fbx_settings: Validated FBX settings
+            
+        Returns:
+            Absolute export directory
+            
+        Raises:
+            ExportError: If the directory cannot be resolved or created
+        """
+        export_directory = fbx_settings.export_directory
+        
+        # If relative path, resolve relative to Maya scene file
+        if not os.path.isabs(export_directory):
+            scene_path = self.maya_scene.get_scene_name()
+            if not scene_path:
+                raise ExportError(f"Cannot use relative path '{export_directory}' - scene is not saved")
+            scene_dir = os.path.dirname(scene_path)
+            export_directory = os.path.normpath(os.path.join(scene_dir, export_directory))
+            logger.info("Resolved relative path: %s -> %s", fbx_settings.export_directory, export_directory)
+        
+        try:
+            os.makedirs(export_directory, exist_ok=True)
+        except OSError as e:
+            raise ExportError(f"Could not create directory '{export_directory}': {e}")
+        
+        return export_directory
+    
+    def _export_members(self, name: str, set_members: Optional[List[str]],
+                        path_prefix: str, fbx_settings: FBXSettings) -> tuple[bool, str]:
+        """
+        Export the members of a group's set with already validated settings.
+        
+        Changes the selection; callers are responsible for restoring it.
+        
+        Args:
+            name: Export group name
+            set_members: Members of the group's set, or None if the set does not exist
+            path_prefix: Export directory joined with the file prefix
+            fbx_settings: Validated FBX settings
+            
+        Returns:
+            Tuple of (success, message)
+        """
         # Check if set exists
-        if not set_name or not self.maya_scene.object_exists(set_name):
+        if set_members is None:
             msg = f"Export set does not exist for '{name}'"
             logger.error(msg)
             return False, msg
         
-        # Get set members
-        set_members = self.maya_scene.get_set_members(set_name)
-        
         if not set_members:
             msg = f"No objects in group '{name}'"
             logger.warning(msg)
             return False, msg
         
         # Build export path
-        filename = f"{fbx_settings.file_prefix}{name}{FBX_EXTENSION}"
+        export_path = f"{path_prefix}{name}{FBX_EXTENSION}"
         
-        # Resolve export directory (handle relative paths)
-        export_directory = fbx_settings.export_directory
-        
-        # If relative path, resolve relative to Maya scene file
-        if not os.path.isabs(export_directory):
-            scene_path = self.maya_scene.get_scene_name()
-            if scene_path:
-                # Relative to scene file directory
-                scene_dir = os.path.dirname(scene_path)
-                export_directory = os.path.normpath(os.path.join(scene_dir, export_directory))
-                logger.info(f"Resolved relative path: {fbx_settings.export_directory} -> {export_directory}")
-            else:
-                msg = f"Cannot use relative path '{export_directory}' - scene is not saved"
-                logger.error(msg)
-                return False, msg
-        
-        export_path = os.path.join(export_directory, filename)
-        
-        # Normalize path for MEL (MEL requires forward slashes on all platforms)
+        # Normalize path for the FBX plugin (expects forward slashes on all platforms)
         # Windows: C:\path\to\file.fbx -> C:/path/to/file.fbx
         # Mac/Linux: /path/to/file.fbx -> /path/to/file.fbx (unchanged)
-        export_path_mel = export_path.replace('\\', '/')
-        
-        # Ensure directory exists
-        if not os.path.exists(export_directory):
-            try:
-                os.makedirs(export_directory)
-                logger.info(f"Created directory: {export_directory}")
-            except Exception as e:
-                msg = f"Could not create directory '{export_directory}': {e}"
-                logger.error(msg)
-                return False, msg
-        
-        # Save current selection
-        previous_selection = self.maya_scene.get_selection()
+        export_path_fbx = export_path.replace('\\', '/')
         
         try:
-            # Apply FBX settings
-            if not self.apply_settings(settings):
-                raise ExportError("Failed to apply FBX settings")
+            # Apply FBX settings (a batch applies them once up front)
+            if not self._settings_applied:
+                self._apply_fbx_settings(fbx_settings)
             
             # Select objects to export
             self.maya_scene.select(set_members, replace=True)
             
-            # Export using MEL (use forward-slash path for MEL compatibility)
-            self.maya_scene.eval_mel(f'FBXExport -f "{export_path_mel}" -s')
-            
-            # Restore selection
-            if previous_selection:
-                self.maya_scene.select(previous_selection, replace=True)
-            else:
-                self.maya_scene.select(clear=True)
+            # Export the selection (path passed as an argument, no MEL quoting involved)
+            self.maya_scene.fbx_export(export_path_fbx, selected_only=True)
             
             msg = f"Exported '{name}' to {export_path}"
             logger.info(msg)
             return True, msg
             
         except Exception as e:
-            # Restore selection on error
-            try:
-                if previous_selection:
-                    self.maya_scene.select(previous_selection, replace=True)
-                else:
-                    self.maya_scene.select(clear=True)
-            except Exception as restore_error:
-                logger.warning(f"Failed to restore selection after export error: {restore_error}")
-            
             msg = f"Error exporting group '{name}': {e}"
             logger.error(msg)
             return False, msg
@@ -3,23 +3,28 @@ Logging Infrastructure
 Centralized logging for the batch exporter with Maya integration.
 """
 
+import functools
 import logging
 import sys
 from typing import Optional
 
+# Checked once at import; outside Maya messages fall back to print
+try:
+    import maya.cmds as cmds
+except ImportError:
+    cmds = None
+
+# Format: [LEVEL] module: message (shared by every handler)
+_FORMATTER = logging.Formatter('[%(levelname)s] %(name)s: %(message)s')
+
 
 class MayaLogHandler(logging.Handler):
     """Custom log handler that integrates with Maya's script editor."""
     
     def __init__(self):
         super().__init__()
-        self.maya_available = False
-        try:
-            import maya.cmds as cmds
-            self.cmds = cmds
-            self.maya_available = True
-        except ImportError:
-            pass
+        self.cmds = cmds
+        self.maya_available = cmds is not None
     
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to Maya's script editor."""
@@ -41,10 +46,13 @@ class MayaLogHandler(logging.Handler):
             self.handleError(record)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger for the batch exporter.
     
+    Results are memoized per name, so repeat calls skip the handler check.
+    
     Args:
         name: Logger name (typically __name__)
         
@@ -60,12 +68,7 @@ def get_logger(name: str) -> logging.Logger:
         # Add Maya handler
         maya_handler = MayaLogHandler()
         maya_handler.setLevel(logging.DEBUG)
-        
-        # Format: [LEVEL] module: message
-        formatter = logging.Formatter(
-            '[%(levelname)s] %(name)s: %(message)s'
-        )
-        maya_handler.setFormatter(formatter)
+        maya_handler.setFormatter(_FORMATTER)
         
         logger.addHandler(maya_handler)
         
@@ -3,25 +3,58 @@ Maya API Facade
 Provides abstraction layer over Maya commands for testability and dependency injection.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om2
+
+# Largest member list passed to a single sets edit
+SET_EDIT_CHUNK_SIZE = 1000
+
+# How long a looked-up active panel is reused (seconds)
+ACTIVE_PANEL_TTL = 0.1
+
+# Shared keyword arguments for per-object/per-set queries, so hot calls
+# merge a prebuilt dict instead of building a new one each time
+_LS_LONG = {"long": True}
+_SETS_QUERY = {"query": True}
+
+# Maya names a panel's isolation set "<panel>ViewSelectedSet"
+ISOLATE_SET_SUFFIX = "ViewSelectedSet"
 
 
 class MayaSceneInterface(ABC):
     """Abstract interface for Maya scene operations."""
+    __slots__ = ()
     
     @abstractmethod
     def object_exists(self, name: str) -> bool:
         """Check if an object exists in the scene."""
         pass
     
+    @abstractmethod
+    def existing_objects(self, names: List[str]) -> Set[str]:
+        """Get the subset of names that exist in the scene."""
+        pass
+    
+    @abstractmethod
+    def filter_existing(self, objects: List[str]) -> List[str]:
+        """Get the long names of the objects that exist, in scene order."""
+        pass
+    
     @abstractmethod
     def create_set(self, name: str, empty: bool = True) -> str:
         """Create a new object set."""
         pass
     
+    @abstractmethod
+    def copy_set(self, source: str, name: str) -> str:
+        """Create a new object set with the same members as an existing one."""
+        pass
+    
     @abstractmethod
     def delete_object(self, name: str) -> None:
         """Delete an object from the scene."""
@@ -33,8 +66,9 @@ class MayaSceneInterface(ABC):
         pass
     
     @abstractmethod
-    def list_objects(self, object_type: Optional[str] = None) -> List[str]:
-        """List objects in the scene, optionally filtered by type."""
+    def list_objects(self, object_type: Optional[str] = None,
+                     pattern: Optional[str] = None) -> List[str]:
+        """List objects in the scene, optionally filtered by type and name pattern."""
         pass
     
     @abstractmethod
@@ -42,6 +76,11 @@ class MayaSceneInterface(ABC):
         """Get members of an object set."""
         pass
     
+    @abstractmethod
+    def get_set_members_many(self, set_names: List[str]) -> Dict[str, List[str]]:
+        """Get members of several object sets, keyed by set name; missing sets are omitted."""
+        pass
+    
     @abstractmethod
     def add_to_set(self, objects: List[str], set_name: str) -> None:
         """Add objects to a set."""
@@ -58,8 +97,9 @@ class MayaSceneInterface(ABC):
         pass
     
     @abstractmethod
-    def select(self, objects: Optional[List[str]] = None, replace: bool = True, clear: bool = False) -> None:
-        """Select objects in the scene."""
+    def select(self, objects: Optional[List[str]] = None, replace: bool = True, clear: bool = False,
+               undoable: bool = True) -> None:
+        """Select objects in the scene; undoable=False keeps internal restores off the undo queue."""
         pass
     
     @abstractmethod
@@ -67,6 +107,31 @@ class MayaSceneInterface(ABC):
         """Force Maya to refresh/update the viewport."""
         pass
     
+    @abstractmethod
+    def suspend_refresh(self, suspend: bool) -> None:
+        """Suspend or resume viewport refreshes."""
+        pass
+    
+    @abstractmethod
+    def open_undo_chunk(self, name: str) -> None:
+        """Open an undo chunk so following operations undo as one step."""
+        pass
+    
+    @abstractmethod
+    def close_undo_chunk(self) -> None:
+        """Close the currently open undo chunk."""
+        pass
+    
+    @abstractmethod
+    def get_evaluation_mode(self) -> str:
+        """Get the evaluation manager mode."""
+        pass
+    
+    @abstractmethod
+    def set_evaluation_mode(self, mode: str) -> None:
+        """Set the evaluation manager mode."""
+        pass
+    
     @abstractmethod
     def get_isolate_set(self, panel: str) -> Optional[str]:
         """Get the name of the isolation set for a panel."""
@@ -74,7 +139,7 @@ class MayaSceneInterface(ABC):
     
     @abstractmethod
     def add_to_isolate_set(self, panel: str, objects: List[str]) -> None:
-        """Add the specified objects to the panel's isolation set."""
+        """Add the specified objects to the panel's isolation set, leaving them selected."""
         pass
 
     @abstractmethod
@@ -102,6 +167,16 @@ class MayaSceneInterface(ABC):
         """Execute a MEL command."""
         pass
     
+    @abstractmethod
+    def apply_fbx_export_settings(self, up_axis: str, triangulate: bool, convert_unit: str) -> None:
+        """Reset the FBX exporter to defaults and apply the given settings."""
+        pass
+    
+    @abstractmethod
+    def fbx_export(self, file_path: str, selected_only: bool = True) -> None:
+        """Export to an FBX file with the current FBX export settings."""
+        pass
+    
     @abstractmethod
     def get_active_panel(self) -> Optional[str]:
         """Get the currently active panel."""
@@ -147,19 +222,26 @@ class MayaSceneInterface(ABC):
         """Find a control by name."""
         pass
     
+    @abstractmethod
+    def get_world_transform(self, obj: str) -> Optional[Tuple[Tuple[float, float, float],
+                                                              Tuple[float, float, float],
+                                                              Tuple[float, float, float]]]:
+        """Get the world space (position, rotation, scale) of an object."""
+        pass
+    
     @abstractmethod
     def get_world_position(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space position of an object."""
+        """Get the world space position of an object (use get_world_transform for several components)."""
         pass
     
     @abstractmethod
     def get_world_rotation(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space rotation of an object."""
+        """Get the world space rotation of an object (use get_world_transform for several components)."""
         pass
     
     @abstractmethod
     def get_world_scale(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space scale of an object."""
+        """Get the world space scale of an object (use get_world_transform for several components)."""
         pass
     
     @abstractmethod
@@ -176,19 +258,150 @@ class MayaSceneInterface(ABC):
     def get_curve_degree(self, curve: str) -> Optional[int]:
         """Get the degree of a curve."""
         pass
+    
+    @abstractmethod
+    def get_set_generation(self) -> int:
+        """Get a counter that advances whenever object sets are added, removed or renamed."""
+        pass
+    
+    @abstractmethod
+    def remove_callbacks(self) -> None:
+        """Remove all Maya callbacks registered by this interface."""
+        pass
 
 
 class MayaSceneAdapter(MayaSceneInterface):
     """Concrete implementation of Maya scene operations using maya.cmds."""
+    __slots__ = (
+        "_set_generation", "_callback_ids",
+        "_plugin_cache", "_panel_type_cache", "_dag_path_cache", "_refresh_suspended",
+        "_active_panel", "_active_panel_time", "_probe",
+    )
+    
+    def __init__(self):
+        """Initialize the adapter and register scene change callbacks."""
+        self._set_generation = 0
+        self._callback_ids: List[int] = []
+        # Query caches, cleared by the callbacks below
+        self._plugin_cache: Dict[str, bool] = {}
+        self._panel_type_cache: Dict[str, str] = {}
+        self._dag_path_cache: Dict[str, str] = {}
+        self._refresh_suspended = False
+        self._active_panel: Optional[str] = None
+        self._active_panel_time = 0.0
+        # Reused by _exists_fast so internal existence checks don't allocate
+        self._probe = om2.MSelectionList()
+        self._register_callbacks()
+    
+    def _register_callbacks(self) -> None:
+        """Register Maya callbacks used to track object set changes."""
+        try:
+            self._callback_ids.append(
+                om2.MDGMessage.addNodeAddedCallback(self._on_set_changed, "objectSet")
+            )
+            self._callback_ids.append(
+                om2.MDGMessage.addNodeRemovedCallback(self._on_set_changed, "objectSet")
+            )
+            # A null node watches renames of every node; sets are filtered in the callback
+            self._callback_ids.append(
+                om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj, self._on_node_renamed)
+            )
+            # Any DAG addition, removal or reparent can change what a name resolves to
+            self._callback_ids.append(
+                om2.MDGMessage.addNodeAddedCallback(self._on_dag_changed, "dagNode")
+            )
+            self._callback_ids.append(
+                om2.MDGMessage.addNodeRemovedCallback(self._on_dag_changed, "dagNode")
+            )
+            self._callback_ids.append(
+                om2.MDagMessage.addAllDagChangesCallback(self._on_dag_changed)
+            )
+            for message in (om2.MSceneMessage.kAfterOpen,
+                            om2.MSceneMessage.kAfterNew,
+                            om2.MSceneMessage.kAfterSave):
+                self._callback_ids.append(
+                    om2.MSceneMessage.addCallback(message, self._on_scene_changed)
+                )
+            for message in (om2.MSceneMessage.kAfterPluginLoad,
+                            om2.MSceneMessage.kAfterPluginUnload):
+                self._callback_ids.append(
+                    om2.MSceneMessage.addStringArrayCallback(message, self._on_plugins_changed)
+                )
+        except Exception:
+            # Without callbacks get_set_generation reports a change on every call
+            self.remove_callbacks()
+    
+    def _on_set_changed(self, *args) -> None:
+        """Advance the set generation when an object set is added or removed."""
+        self._set_generation += 1
+    
+    def _on_node_renamed(self, node, *args) -> None:
+        """Advance the set generation when an object set is renamed."""
+        if node.hasFn(om2.MFn.kSet):
+            self._set_generation += 1
+        elif self._dag_path_cache:
+            self._dag_path_cache.clear()
+    
+    def _on_dag_changed(self, *args) -> None:
+        """Forget resolved DAG paths when the hierarchy changes."""
+        if self._dag_path_cache:
+            self._dag_path_cache.clear()
+    
+    def _on_scene_changed(self, *args) -> None:
+        """Invalidate scene-bound caches when a scene is opened, created or saved."""
+        # Set callbacks may not fire for every node during file I/O, so
+        # treat a scene change as a set change
+        self._set_generation += 1
+        # Panels are rebuilt along with the scene UI
+        self._panel_type_cache.clear()
+        self._dag_path_cache.clear()
+    
+    def _on_plugins_changed(self, *args) -> None:
+        """Forget cached plugin states when any plugin is loaded or unloaded."""
+        self._plugin_cache.clear()
     
     def object_exists(self, name: str) -> bool:
         """Check if an object exists in the scene."""
         return cmds.objExists(name)
     
+    def _exists_fast(self, name: str) -> bool:
+        """Check existence through the API, without command dispatch, for internal hot paths."""
+        probe = self._probe
+        probe.clear()
+        try:
+            probe.add(name)
+        except RuntimeError:
+            return False
+        return True
+    
+    def existing_objects(self, names: List[str]) -> Set[str]:
+        """Get the subset of names that exist in the scene."""
+        # One selection list resolves every name without an objExists round-trip each
+        existing: Set[str] = set()
+        selection = om2.MSelectionList()
+        for name in names:
+            try:
+                selection.add(name)
+            except RuntimeError:
+                continue
+            existing.add(name)
+        return existing
+    
+    def filter_existing(self, objects: List[str]) -> List[str]:
+        """Get the long names of the objects that exist, in scene order."""
+        if not objects:
+            return []
+        # ls silently drops missing names, so one call replaces an objExists per object
+        return cmds.ls(objects, **_LS_LONG) or []
+    
     def create_set(self, name: str, empty: bool = True) -> str:
         """Create a new object set."""
         return cmds.sets(name=name, empty=empty)
     
+    def copy_set(self, source: str, name: str) -> str:
+        """Create a new object set with the same members as an existing one."""
+        return cmds.sets(name=name, copy=source)
+    
     def delete_object(self, name: str) -> None:
         """Delete an object from the scene."""
         cmds.delete(name)
@@ -197,26 +410,37 @@ class MayaSceneAdapter(MayaSceneInterface):
         """Rename an object."""
         return cmds.rename(old_name, new_name)
     
-    def list_objects(self, object_type: Optional[str] = None) -> List[str]:
-        """List objects in the scene, optionally filtered by type."""
-        result = cmds.ls(type=object_type) if object_type else cmds.ls()
+    def list_objects(self, object_type: Optional[str] = None,
+                     pattern: Optional[str] = None) -> List[str]:
+        """List objects in the scene, optionally filtered by type and name pattern."""
+        # Wildcard patterns are matched by Maya itself rather than filtered in Python
+        args = [pattern] if pattern else []
+        result = cmds.ls(*args, type=object_type) if object_type else cmds.ls(*args)
         return result or []
     
     def get_set_members(self, set_name: str) -> List[str]:
         """Get members of an object set."""
-        if not self.object_exists(set_name):
+        if not self._exists_fast(set_name):
             return []
-        result = cmds.sets(set_name, query=True)
+        result = cmds.sets(set_name, **_SETS_QUERY)
         return result or []
     
+    def get_set_members_many(self, set_names: List[str]) -> Dict[str, List[str]]:
+        """Get members of several object sets, keyed by set name; missing sets are omitted."""
+        existing = self.existing_objects(set_names)
+        return {
+            set_name: cmds.sets(set_name, **_SETS_QUERY) or []
+            for set_name in set_names if set_name in existing
+        }
+    
     def add_to_set(self, objects: List[str], set_name: str) -> None:
         """Add objects to a set."""
-        if objects and self.object_exists(set_name):
+        if objects and self._exists_fast(set_name):
             cmds.sets(objects, addElement=set_name)
     
     def remove_from_set(self, objects: List[str], set_name: str) -> None:
         """Remove objects from a set."""
-        if objects and self.object_exists(set_name):
+        if objects and self._exists_fast(set_name):
             cmds.sets(objects, remove=set_name)
     
     def get_selection(self, long: bool = False) -> List[str]:
@@ -228,18 +452,33 @@ class MayaSceneAdapter(MayaSceneInterface):
         """Get the long (full DAG) path for a node if it exists."""
         if not node:
             return None
+        cached = self._dag_path_cache.get(node)
+        if cached is not None:
+            return cached
         try:
-            long_paths = cmds.ls(node, long=True)
+            long_paths = cmds.ls(node, **_LS_LONG)
             if long_paths:
+                # Only cache while the DAG callbacks can invalidate the entry
+                if self._callback_ids:
+                    self._dag_path_cache[node] = long_paths[0]
                 return long_paths[0]
         except Exception:
             pass
         return node
     
-    def select(self, objects: Optional[List[str]] = None, replace: bool = True, clear: bool = False) -> None:
+    def select(self, objects: Optional[List[str]] = None, replace: bool = True, clear: bool = False,
+               undoable: bool = True) -> None:
         """Select objects in the scene."""
         if clear:
             cmds.select(clear=True)
+        elif objects and not undoable:
+            # Build the selection list directly rather than have cmds parse every name;
+            # API selection changes don't reach the undo queue
+            selection = om2.MSelectionList()
+            for obj in objects:
+                selection.add(obj)
+            mode = om2.MGlobal.kReplaceList if replace else om2.MGlobal.kAddToList
+            om2.MGlobal.setActiveSelectionList(selection, mode)
         elif objects:
             cmds.select(objects, replace=replace)
     
@@ -247,6 +486,48 @@ class MayaSceneAdapter(MayaSceneInterface):
         """Force Maya to refresh/update the viewport."""
         cmds.refresh()
     
+    def suspend_refresh(self, suspend: bool) -> None:
+        """Suspend or resume viewport refreshes."""
+        cmds.refresh(suspend=suspend)
+        self._refresh_suspended = suspend
+    
+    @staticmethod
+    def _chunked(items: List[str], size: int = SET_EDIT_CHUNK_SIZE) -> Iterator[List[str]]:
+        """Yield consecutive slices of at most size items."""
+        for i in range(0, len(items), size):
+            yield items[i:i + size]
+    
+    @contextmanager
+    def _frozen_viewport(self) -> Iterator[None]:
+        """Suspend viewport refreshes for a multi-step edit, redrawing once at the end."""
+        if self._refresh_suspended:
+            # An enclosing batch already suspended refresh and will resume it
+            yield
+            return
+        self.suspend_refresh(True)
+        try:
+            yield
+        finally:
+            self.suspend_refresh(False)
+            cmds.refresh()
+    
+    def open_undo_chunk(self, name: str) -> None:
+        """Open an undo chunk so following operations undo as one step."""
+        cmds.undoInfo(openChunk=True, chunkName=name)
+    
+    def close_undo_chunk(self) -> None:
+        """Close the currently open undo chunk."""
+        cmds.undoInfo(closeChunk=True)
+    
+    def get_evaluation_mode(self) -> str:
+        """Get the evaluation manager mode."""
+        result = cmds.evaluationManager(query=True, mode=True)
+        return result[0] if result else ""
+    
+    def set_evaluation_mode(self, mode: str) -> None:
+        """Set the evaluation manager mode."""
+        cmds.evaluationManager(mode=mode)
+    
     def get_isolate_set(self, panel: str) -> Optional[str]:
         """Get the name of the isolation set for a panel."""
         try:
@@ -257,30 +538,38 @@ class MayaSceneAdapter(MayaSceneInterface):
             return None
     
     def add_to_isolate_set(self, panel: str, objects: List[str]) -> None:
-        """Add specified objects to the panel's isolation set."""
+        """Add the specified objects to the panel's isolation set."""
         if not objects:
             return
-        for obj in objects:
-            if obj and cmds.objExists(obj):
-                cmds.isolateSelect(panel, addDagObject=obj)
+        valid = self.filter_existing(objects)
+        if not valid:
+            return
+        # One addSelected rebuilds the isolation set once, not once per object.
+        # The selection it needs is set and restored through the API, so the
+        # user's selection is kept and nothing lands on the undo queue
+        saved = om2.MGlobal.getActiveSelectionList()
+        with self._frozen_viewport():
+            try:
+                self.select(valid, replace=True, undoable=False)
+                cmds.isolateSelect(panel, addSelected=True)
+            finally:
+                om2.MGlobal.setActiveSelectionList(saved, om2.MGlobal.kReplaceList)
 
     def clear_isolate_set(self, panel: str) -> None:
         """Clear all objects from the panel's isolation set."""
-        # Turn isolation ON briefly to ensure the set exists
-        was_on = cmds.isolateSelect(panel, query=True, state=True)
-        if not was_on:
-            cmds.isolateSelect(panel, state=True)
-        
-        # Now get and clear the set
-        isolate_set = self.get_isolate_set(panel)
-        if isolate_set and cmds.objExists(isolate_set):
-            members = cmds.sets(isolate_set, query=True) or []
-            if members:
-                cmds.sets(members, remove=isolate_set)
+        # A set that doesn't exist yet or is already empty needs no work, and
+        # leaving isolation untouched avoids two viewport rebuilds
+        isolate_set = panel + ISOLATE_SET_SUFFIX
+        if not self._exists_fast(isolate_set):
+            return
+        members = cmds.sets(isolate_set, query=True)
+        if not members:
+            return
         
-        # Turn it back off if it was off
-        if not was_on:
-            cmds.isolateSelect(panel, state=False)
+        with self._frozen_viewport():
+            # Huge isolation sets are emptied in slices to keep each command small
+            for chunk in self._chunked(members):
+                cmds.sets(chunk, remove=isolate_set)
 
     def get_scene_name(self) -> str:
         """Get the current scene file path."""
@@ -289,27 +578,59 @@ class MayaSceneAdapter(MayaSceneInterface):
     def load_plugin(self, plugin_name: str) -> None:
         """Load a Maya plugin."""
         cmds.loadPlugin(plugin_name)
+        self._plugin_cache[plugin_name] = True
     
     def is_plugin_loaded(self, plugin_name: str) -> bool:
         """Check if a plugin is loaded."""
-        return cmds.pluginInfo(plugin_name, query=True, loaded=True)
+        loaded = self._plugin_cache.get(plugin_name)
+        if loaded is None:
+            loaded = bool(cmds.pluginInfo(plugin_name, query=True, loaded=True))
+            # Only cache while the plugin callbacks can invalidate the entry
+            if self._callback_ids:
+                self._plugin_cache[plugin_name] = loaded
+        return loaded
     
     def eval_mel(self, command: str) -> Any:
         """Execute a MEL command."""
         return mel.eval(command)
     
+    def apply_fbx_export_settings(self, up_axis: str, triangulate: bool, convert_unit: str) -> None:
+        """Reset the FBX exporter to defaults and apply the given settings."""
+        # The fbxmaya plugin registers its commands with cmds, so no MEL parsing is needed
+        cmds.FBXResetExport()
+        cmds.FBXExportUpAxis(up_axis)
+        cmds.FBXExportTriangulate(v=triangulate)
+        cmds.FBXExportConvertUnitString(convert_unit)
+    
+    def fbx_export(self, file_path: str, selected_only: bool = True) -> None:
+        """Export to an FBX file with the current FBX export settings."""
+        cmds.FBXExport(f=file_path, s=selected_only)
+    
     def get_active_panel(self) -> Optional[str]:
         """Get the currently active panel."""
+        # Focus rarely changes between back-to-back calls within one tool action
+        now = time.monotonic()
+        if self._active_panel and now - self._active_panel_time < ACTIVE_PANEL_TTL:
+            return self._active_panel
+        
         panel = cmds.getPanel(withFocus=True)
-        if not panel or cmds.getPanel(typeOf=panel) != "modelPanel":
+        if not panel or self.get_panel_type(panel) != "modelPanel":
             panel = cmds.playblast(activeEditor=True)
             if not panel or "modelPanel" not in panel:
                 return None
+        
+        self._active_panel = panel
+        self._active_panel_time = now
         return panel
     
     def get_panel_type(self, panel: str) -> str:
         """Get the type of a panel."""
-        return cmds.getPanel(typeOf=panel)
+        panel_type = self._panel_type_cache.get(panel)
+        if panel_type is None:
+            panel_type = cmds.getPanel(typeOf=panel)
+            if panel_type:
+                self._panel_type_cache[panel] = panel_type
+        return panel_type
     
     def isolate_select(self, panel: str, state: Optional[bool] = None, 
                       add_selected: bool = False, load_selected: bool = False,
@@ -352,6 +673,9 @@ class MayaSceneAdapter(MayaSceneInterface):
     def delete_ui(self, name: str) -> None:
         """Delete a UI element."""
         cmds.deleteUI(name)
+        self._panel_type_cache.pop(name, None)
+        if name == self._active_panel:
+            self._active_panel = None
     
     def create_workspace_control(self, name: str, **kwargs) -> None:
         """Create a workspace control."""
@@ -363,94 +687,132 @@ class MayaSceneAdapter(MayaSceneInterface):
         control_ptr = omui.MQtUtil.findControl(name)
         return int(control_ptr) if control_ptr else None
     
-    def get_world_position(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space position of an object."""
-        try:
-            if not cmds.objExists(obj):
-                return None
-            pos = cmds.xform(obj, query=True, worldSpace=True, translation=True)
-            return (pos[0], pos[1], pos[2])
-        except Exception:
+    def get_world_transform(self, obj: str) -> Optional[Tuple[Tuple[float, float, float],
+                                                              Tuple[float, float, float],
+                                                              Tuple[float, float, float]]]:
+        """
+        Get the world space (position, rotation, scale) of an object.
+        
+        Position and scale come from one world matrix decomposition; rotation
+        stays on xform so it keeps xform's Euler angles for every rotate order
+        and for joint orients.
+        """
+        matrix = self._world_matrix(obj)
+        if matrix is None:
+            return None
+        rotation = self._world_rotation(obj)
+        if rotation is None:
             return None
+        return self._world_position(matrix), rotation, self._world_scale(matrix)
+    
+    def get_world_position(self, obj: str) -> Optional[Tuple[float, float, float]]:
+        """Get the world space position of an object (use get_world_transform for several components)."""
+        matrix = self._world_matrix(obj)
+        return self._world_position(matrix) if matrix is not None else None
     
     def get_world_rotation(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space rotation of an object."""
-        try:
-            if not cmds.objExists(obj):
-                return None
-            rot = cmds.xform(obj, query=True, worldSpace=True, rotation=True)
-            return (rot[0], rot[1], rot[2])
-        except Exception:
-            return None
+        """Get the world space rotation of an object (use get_world_transform for several components)."""
+        return self._world_rotation(obj)
     
     def get_world_scale(self, obj: str) -> Optional[Tuple[float, float, float]]:
-        """Get the world space scale of an object."""
+        """Get the world space scale of an object (use get_world_transform for several components)."""
+        matrix = self._world_matrix(obj)
+        return self._world_scale(matrix) if matrix is not None else None
+    
+    @staticmethod
+    def _world_matrix(obj: str) -> Optional[om2.MTransformationMatrix]:
+        """Get the decomposable world matrix of an object."""
+        selection = om2.MSelectionList()
         try:
-            if not cmds.objExists(obj):
-                return None
-            scale = cmds.xform(obj, query=True, worldSpace=True, scale=True)
-            return (scale[0], scale[1], scale[2])
-        except Exception:
+            selection.add(obj)
+            dag_path = selection.getDagPath(0)
+        except (RuntimeError, TypeError):
             return None
+        
+        return om2.MTransformationMatrix(dag_path.inclusiveMatrix())
+    
+    # The API works in internal units; these convert to the user's UI units like cmds
+    
+    @staticmethod
+    def _world_position(matrix: om2.MTransformationMatrix) -> Tuple[float, float, float]:
+        """Get the translation of a world matrix in UI distance units."""
+        to_ui = om2.MDistance.internalToUI
+        pos = matrix.translation(om2.MSpace.kWorld)
+        return to_ui(pos.x), to_ui(pos.y), to_ui(pos.z)
+    
+    @staticmethod
+    def _world_rotation(obj: str) -> Optional[Tuple[float, float, float]]:
+        """Get the world space rotation of an object exactly as xform reports it."""
+        # Not decomposed from the matrix: that can pick different (equivalent)
+        # Euler angles for non-xyz rotate orders and joint orients
+        try:
+            rot = cmds.xform(obj, query=True, worldSpace=True, rotation=True)
+        except (RuntimeError, ValueError):
+            return None
+        return (rot[0], rot[1], rot[2])
+    
+    @staticmethod
+    def _world_scale(matrix: om2.MTransformationMatrix) -> Tuple[float, float, float]:
+        """Get the scale of a world matrix."""
+        scale = matrix.scale(om2.MSpace.kWorld)
+        return scale[0], scale[1], scale[2]
     
     def is_curve(self, obj: str) -> bool:
         """Check if an object is a NURBS curve."""
+        # objectType doubles as the existence check (it raises for missing objects)
         try:
-            if not cmds.objExists(obj):
-                return False
-            # Check if it's a transform with a curve shape
-            shapes = cmds.listRelatives(obj, shapes=True, type='nurbsCurve') or []
-            if shapes:
+            if cmds.objectType(obj) == 'nurbsCurve':
                 return True
-            # Check if it's directly a curve shape
-            return cmds.objectType(obj) == 'nurbsCurve'
-        except Exception:
+        except RuntimeError:
             return False
+        # Check if it's a transform with a curve shape
+        return bool(cmds.listRelatives(obj, shapes=True, type='nurbsCurve'))
+    
+    @staticmethod
+    def _get_curve_fn(curve: str) -> Optional[om2.MFnNurbsCurve]:
+        """Get a curve function set for a curve shape or for the first curve shape under a transform."""
+        selection = om2.MSelectionList()
+        try:
+            selection.add(curve)
+            dag_path = selection.getDagPath(0)
+        except (RuntimeError, TypeError):
+            return None
+        
+        if dag_path.hasFn(om2.MFn.kNurbsCurve):
+            return om2.MFnNurbsCurve(dag_path)
+        
+        for i in range(dag_path.numberOfShapesDirectlyBelow()):
+            shape_path = om2.MDagPath(dag_path)
+            shape_path.extendToShape(i)
+            if shape_path.hasFn(om2.MFn.kNurbsCurve):
+                return om2.MFnNurbsCurve(shape_path)
+        return None
     
     def get_curve_cvs(self, curve: str) -> Optional[List[Tuple[float, float, float]]]:
         """Get all CV positions for a curve in world space."""
-        try:
-            if not cmds.objExists(curve):
-                return None
-            
-            # Get the curve shape if it's a transform
-            curve_shape = curve
-            if cmds.objectType(curve) == 'transform':
-                shapes = cmds.listRelatives(curve, shapes=True, type='nurbsCurve')
-                if not shapes:
-                    return None
-                curve_shape = shapes[0]
-            
-            # Get number of CVs
-            degree = cmds.getAttr(f"{curve_shape}.degree")
-            spans = cmds.getAttr(f"{curve_shape}.spans")
-            num_cvs = spans + degree
-            
-            # Get CV positions in world space
-            cvs = []
-            for i in range(num_cvs):
-                pos = cmds.xform(f"{curve_shape}.cv[{i}]", query=True, worldSpace=True, translation=True)
-                cvs.append((pos[0], pos[1], pos[2]))
-            
-            return cvs
-        except Exception:
+        curve_fn = self._get_curve_fn(curve)
+        if curve_fn is None:
             return None
+        
+        # One API call returns every CV; convert from internal units like xform would
+        to_ui = om2.MDistance.internalToUI
+        return [(to_ui(p.x), to_ui(p.y), to_ui(p.z))
+                for p in curve_fn.cvPositions(om2.MSpace.kWorld)]
     
     def get_curve_degree(self, curve: str) -> Optional[int]:
         """Get the degree of a curve."""
-        try:
-            if not cmds.objExists(curve):
-                return None
-            
-            # Get the curve shape if it's a transform
-            curve_shape = curve
-            if cmds.objectType(curve) == 'transform':
-                shapes = cmds.listRelatives(curve, shapes=True, type='nurbsCurve')
-                if not shapes:
-                    return None
-                curve_shape = shapes[0]
-            
-            return cmds.getAttr(f"{curve_shape}.degree")
-        except Exception:
-            return None
-
+        curve_fn = self._get_curve_fn(curve)
+        return curve_fn.degree if curve_fn is not None else None
+    
+    def get_set_generation(self) -> int:
+        """Get a counter that advances whenever object sets are added, removed or renamed."""
+        if not self._callback_ids:
+            # Changes can't be observed, so always report the scene as changed
+            self._set_generation += 1
+        return self._set_generation
+    
+    def remove_callbacks(self) -> None:
+        """Remove all Maya callbacks registered by this adapter."""
+        if self._callback_ids:
+            om2.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
@@ -3,22 +3,32 @@ Configuration Persistence
 Handles saving and loading export configurations to/from JSON files.
 """
 
-import json
+import functools
+import mmap
 import os
+import stat
+import tempfile
 from abc import ABC, abstractmethod
 from typing import Optional
 from .types import ExportDataDict
 from .constants import (
     EXPORT_GROUPS_SUFFIX, JSON_EXTENSION, UNTITLED_SCENE_FILENAME,
-    DEFAULT_UP_AXIS, DEFAULT_TRIANGULATE, DEFAULT_CONVERT_UNIT,
-    DEFAULT_EXPORT_DIRECTORY, DEFAULT_FILE_PREFIX
+    DEFAULT_FBX_SETTINGS
 )
 from .exceptions import DataPersistenceError, ValidationError
 from .validators import PathValidator
 from .logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+# FBX settings keys a config file must provide
+_REQUIRED_FBX_FIELDS = frozenset(DEFAULT_FBX_SETTINGS)
+
 
 class ConfigRepository(ABC):
     """Abstract interface for configuration persistence."""
@@ -84,30 +94,35 @@ class JsonConfigRepository(ConfigRepository):
         """
         try:
             # Validate path
-            file_path = PathValidator.validate_file_path(
-                file_path, 
-                must_exist=False, 
-                extensions=[JSON_EXTENSION]
-            )
+            file_path = self._validated_path(file_path)
             
-            # Ensure directory exists
+            # Ensure directory exists (one call, no separate exists() stat)
             directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
+            if directory:
                 try:
-                    os.makedirs(directory)
-                    logger.info(f"Created directory: {directory}")
-                except Exception as e:
+                    os.makedirs(directory, exist_ok=True)
+                except OSError as e:
                     raise DataPersistenceError(f"Failed to create directory '{directory}': {e}")
             
-            # Check if path is writable
-            if not PathValidator.is_path_writable(file_path):
-                raise DataPersistenceError(f"Path is not writable: {file_path}")
+            # Serialize to bytes (orjson encodes straight to UTF-8 when available);
+            # keys are sorted so unchanged data always produces identical files, and
+            # both backends use the same layout so the bytes don't depend on orjson
+            if orjson is not None:
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+                )
+            else:
+                import json  # deferred: only the stdlib fallback needs it
+                payload = (json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode('utf-8')
             
-            # Write JSON file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            # An unwritable location surfaces here as an OSError
+            try:
+                self._write_atomic(file_path, payload)
+            except OSError as e:
+                raise DataPersistenceError(f"Could not write '{file_path}': {e}")
             
-            logger.info(f"Saved configuration to: {file_path}")
+            logger.info("Saved configuration to: %s", file_path)
             
         except ValidationError:
             raise
@@ -116,6 +131,69 @@ class JsonConfigRepository(ConfigRepository):
         except Exception as e:
             raise DataPersistenceError(f"Failed to save configuration: {e}")
     
+    @staticmethod
+    def _validated_path(file_path: str) -> str:
+        """
+        Validate and normalize a config file path.
+        
+        Args:
+            file_path: Path to validate
+            
+        Returns:
+            Normalized file path
+            
+        Raises:
+            ValidationError: If file path is invalid
+        """
+        return PathValidator.validate_file_path(
+            file_path,
+            must_exist=False,
+            extensions=[JSON_EXTENSION]
+        )
+    
+    @staticmethod
+    def _write_atomic(file_path: str, payload: bytes) -> None:
+        """
+        Write bytes to a file through a temp file and an atomic rename.
+        
+        The data is fsynced before the rename, so neither a crash nor a power
+        loss can leave a truncated or empty config in place. The temp file
+        gets a unique name, so concurrent saves don't collide, and takes over
+        the existing file's permission bits.
+        
+        Args:
+            file_path: Destination file path
+            payload: File contents
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or None,
+            prefix=os.path.basename(file_path) + ".",
+            suffix=".tmp"
+        )
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            # mkstemp creates the file owner-only; keep the config's own mode
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            
+            os.replace(tmp_path, file_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def load(self, file_path: str) -> ExportDataDict:
         """
         Load configuration data from a JSON file.
@@ -127,49 +205,36 @@ class JsonConfigRepository(ConfigRepository):
             Export configuration data
             
         Raises:
+            FileNotFoundError: If the file does not exist
             DataPersistenceError: If load fails
             ValidationError: If file path is invalid
         """
         try:
-            # Validate path
-            file_path = PathValidator.validate_file_path(
-                file_path,
-                must_exist=True,
-                extensions=[JSON_EXTENSION]
-            )
-            
-            # Read JSON file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Validate path (existence is left to open() to avoid an extra stat)
+            file_path = self._validated_path(file_path)
             
-            # Strict validation - no backwards compatibility
-            if not isinstance(data, dict):
-                raise DataPersistenceError("Invalid configuration format: expected dictionary")
+            # Read JSON file (orjson parses straight from the mapped pages;
+            # an empty file can't be mapped and is read so it fails as bad JSON)
+            with open(file_path, 'rb') as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size == 0:
+                    data = orjson.loads(f.read())
+                elif orjson is not None:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            data = orjson.loads(view)
+                else:
+                    import json  # deferred: only the stdlib fallback needs it
+                    data = json.loads(f.read())
             
-            if "export_groups" not in data:
-                raise DataPersistenceError("Invalid configuration: missing 'export_groups' field")
+            self._validate_config(data)
             
-            if "fbx_settings" not in data:
-                raise DataPersistenceError("Invalid configuration: missing 'fbx_settings' field")
-            
-            # Validate required settings fields
-            required_settings = ["up_axis", "triangulate", "convert_unit", "export_directory", "file_prefix"]
-            missing_fields = [field for field in required_settings if field not in data["fbx_settings"]]
-            if missing_fields:
-                raise DataPersistenceError(f"Invalid configuration: missing FBX settings fields: {missing_fields}")
-            
-            # expanded_groups is optional (for backwards compatibility with newly created files)
-            if "expanded_groups" not in data:
-                data["expanded_groups"] = []
-            
-            logger.info(f"Loaded configuration from: {file_path}")
+            logger.info("Loaded configuration from: %s", file_path)
             return data
             
-        except ValidationError:
+        except (ValidationError, DataPersistenceError, FileNotFoundError):
             raise
-        except DataPersistenceError:
-            raise
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
             raise DataPersistenceError(f"Invalid JSON format: {e}")
         except Exception as e:
             raise DataPersistenceError(f"Failed to load configuration: {e}")
@@ -184,18 +249,68 @@ class JsonConfigRepository(ConfigRepository):
         Returns:
             True if file exists
         """
-        return os.path.exists(file_path) and os.path.isfile(file_path)
+        return os.path.isfile(file_path)
+    
+    @staticmethod
+    def _validate_config(data) -> None:
+        """
+        Validate a parsed configuration in place.
+        
+        Only the root object and its fbx_settings are inspected, so this is a
+        handful of key lookups regardless of how many groups the file holds.
+        
+        Args:
+            data: Parsed JSON document
+            
+        Raises:
+            DataPersistenceError: If required fields are missing
+        """
+        # Strict validation - no backwards compatibility
+        if not isinstance(data, dict):
+            raise DataPersistenceError("Invalid configuration format: expected dictionary")
+        
+        if "export_groups" not in data:
+            raise DataPersistenceError("Invalid configuration: missing 'export_groups' field")
+        
+        if "fbx_settings" not in data:
+            raise DataPersistenceError("Invalid configuration: missing 'fbx_settings' field")
+        
+        if not isinstance(data["fbx_settings"], dict):
+            raise DataPersistenceError("Invalid configuration: 'fbx_settings' must be a dictionary")
+        
+        # Validate required settings fields
+        missing_fields = _REQUIRED_FBX_FIELDS - data["fbx_settings"].keys()
+        if missing_fields:
+            raise DataPersistenceError(
+                f"Invalid configuration: missing FBX settings fields: {sorted(missing_fields)}"
+            )
+        
+        # expanded_groups is optional (for backwards compatibility with newly created files)
+        data.setdefault("expanded_groups", [])
     
     @staticmethod
     def _get_default_fbx_settings() -> dict:
         """Get default FBX settings."""
-        return {
-            "up_axis": DEFAULT_UP_AXIS,
-            "triangulate": DEFAULT_TRIANGULATE,
-            "convert_unit": DEFAULT_CONVERT_UNIT,
-            "export_directory": DEFAULT_EXPORT_DIRECTORY,
-            "file_prefix": DEFAULT_FILE_PREFIX,
-        }
+        return dict(DEFAULT_FBX_SETTINGS)
+
+
+@functools.lru_cache(maxsize=32)
+def _config_path_for_scene(scene_path: str) -> str:
+    """
+    Map a scene file path to its config file path.
+    
+    Args:
+        scene_path: Scene file path, empty for an untitled scene
+        
+    Returns:
+        JSON config file path
+    """
+    if scene_path:
+        # Use scene name + suffix
+        return os.path.splitext(scene_path)[0] + EXPORT_GROUPS_SUFFIX + JSON_EXTENSION
+    
+    # Untitled scene - save to home directory
+    return os.path.join(os.path.expanduser("~"), UNTITLED_SCENE_FILENAME)
 
 
 class ConfigPathResolver:
@@ -217,19 +332,7 @@ class ConfigPathResolver:
         Returns:
             Default JSON file path
         """
-        scene_path = self.maya_scene.get_scene_name()
-        
-        if scene_path:
-            # Use scene name + suffix
-            base_name = os.path.splitext(scene_path)[0]
-            json_path = base_name + EXPORT_GROUPS_SUFFIX + JSON_EXTENSION
-        else:
-            # Untitled scene - save to home directory
-            json_path = os.path.join(
-                os.path.expanduser("~"),
-                UNTITLED_SCENE_FILENAME
-            )
-        
-        logger.debug(f"Default config path: {json_path}")
+        json_path = _config_path_for_scene(self.maya_scene.get_scene_name())
+        logger.debug("Default config path: %s", json_path)
         return json_path
 
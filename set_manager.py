@@ -3,7 +3,9 @@ Set Manager
 Handles Maya object set operations.
 """
 
-from typing import List, Optional
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set
 from .maya_facade import MayaSceneInterface
 from .constants import SET_PREFIX
 from .exceptions import SetNotFoundError, MayaOperationError
@@ -12,6 +14,9 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Component suffixes on set members (e.g., .vtx[], .f[], .e[])
+_COMPONENT_SUFFIX_RE = re.compile(r"\.(?:vtx|f|e)\[.*")
+
 
 class SetManager:
     """Manages Maya object sets for export groups."""
@@ -24,6 +29,58 @@ class SetManager:
             maya_scene: Maya scene interface for operations
         """
         self.maya_scene = maya_scene
+        
+        # Export set names, valid while the scene's set generation is unchanged
+        self._list_cache: Optional[List[str]] = None
+        self._cache_gen = -1
+        
+        # Export set names snapshotted by batch(); None outside a batch
+        self._existence_cache: Optional[Set[str]] = None
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Answer set existence checks from one snapshot while the block runs.
+        
+        The export sets are listed once on entry and the snapshot is kept up
+        to date by this manager's own create/delete/rename calls, so a bulk
+        operation costs one scene query instead of an objExists per set.
+        Nested batches share the outer snapshot.
+        """
+        if self._existence_cache is not None:
+            yield
+            return
+        
+        self._existence_cache = set(self.list_export_sets())
+        try:
+            yield
+        finally:
+            self._existence_cache = None
+    
+    def _set_exists(self, set_name: str) -> bool:
+        """
+        Check whether a set exists, using the batch snapshot when one is active.
+        
+        Args:
+            set_name: Name of the set
+            
+        Returns:
+            True if the set exists
+        """
+        cache = self._existence_cache
+        if cache is not None and set_name.startswith(SET_PREFIX):
+            return set_name in cache
+        return self.maya_scene.object_exists(set_name)
+    
+    def _track_set(self, added: Optional[str] = None, removed: Optional[str] = None) -> None:
+        """Keep the batch snapshot in step with a set this manager created or removed."""
+        cache = self._existence_cache
+        if cache is None:
+            return
+        if removed:
+            cache.discard(removed)
+        if added:
+            cache.add(added)
     
     def create_set_name(self, group_name: str) -> str:
         """
@@ -35,8 +92,7 @@ class SetManager:
         Returns:
             Maya set name with prefix
         """
-        sanitized = NameValidator.sanitize_for_maya_name(group_name)
-        return SET_PREFIX + sanitized
+        return SET_PREFIX + NameValidator.sanitize_for_maya_name(group_name)
     
     def get_unique_set_name(self, desired_name: str) -> str:
         """
@@ -48,16 +104,26 @@ class SetManager:
         Returns:
             Unique set name
         """
+        # Sanitized once; the numbered variants below only append a suffix
         set_name = self.create_set_name(desired_name)
         
         if not self.maya_scene.object_exists(set_name):
             return set_name
         
+        # One wildcard query for all numbered variants instead of probing each
+        suffix_re = re.compile(re.escape(set_name) + r"_(\d+)$")
+        taken = set()
+        for name in self.maya_scene.list_objects(pattern=f"{set_name}_*"):
+            # DAG nodes with clashing short names come back as parent|name paths
+            match = suffix_re.match(name.rsplit("|", 1)[-1])
+            if match:
+                taken.add(int(match.group(1)))
+        
         counter = 1
-        while self.maya_scene.object_exists(f"{set_name}_{counter}"):
+        while counter in taken:
             counter += 1
         
-        return f"{set_name}_{counter}"
+        return set_name + "_" + str(counter)
     
     def create_set(self, group_name: str) -> str:
         """
@@ -75,7 +141,8 @@ class SetManager:
         try:
             set_name = self.get_unique_set_name(group_name)
             self.maya_scene.create_set(set_name, empty=True)
-            logger.info(f"Created set: {set_name}")
+            self._track_set(added=set_name)
+            logger.info("Created set: %s", set_name)
             return set_name
         except Exception as e:
             raise MayaOperationError(f"Failed to create set '{group_name}': {e}")
@@ -91,12 +158,13 @@ class SetManager:
             SetNotFoundError: If set doesn't exist
             MayaOperationError: If deletion fails
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         try:
             self.maya_scene.delete_object(set_name)
-            logger.info(f"Deleted set: {set_name}")
+            self._track_set(removed=set_name)
+            logger.info("Deleted set: %s", set_name)
         except Exception as e:
             raise MayaOperationError(f"Failed to delete set '{set_name}': {e}")
     
@@ -115,14 +183,15 @@ class SetManager:
             SetNotFoundError: If set doesn't exist
             MayaOperationError: If rename fails
         """
-        if not self.maya_scene.object_exists(old_name):
+        if not self._set_exists(old_name):
             raise SetNotFoundError(f"Set does not exist: {old_name}")
         
         try:
             new_set_name = self.get_unique_set_name(new_display_name)
             if new_set_name != old_name:
                 actual_name = self.maya_scene.rename_object(old_name, new_set_name)
-                logger.info(f"Renamed set from {old_name} to {actual_name}")
+                self._track_set(added=actual_name, removed=old_name)
+                logger.info("Renamed set from %s to %s", old_name, actual_name)
                 return actual_name
             return old_name
         except Exception as e:
@@ -141,35 +210,58 @@ class SetManager:
         Raises:
             SetNotFoundError: If set doesn't exist
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         try:
-            members = self.maya_scene.get_set_members(set_name)
-            
-            clean_members: List[str] = []
-            for member in members:
-                if member is None:
-                    continue
-                # Strip component suffixes (e.g., .vtx[], .f[], .e[])
-                for suffix in ['.vtx[', '.f[', '.e[']:
-                    if suffix in member:
-                        member = member.split(suffix)[0]
-                # Resolve to long (full DAG) path to avoid ambiguity
-                resolved = self.maya_scene.get_dag_path(member)
-                clean_members.append(resolved or member)
+            return self._members_to_objects(self.maya_scene.get_set_members(set_name))
+        except Exception as e:
+            raise MayaOperationError(f"Failed to get objects from set '{set_name}': {e}")
+    
+    def get_set_objects_many(self, set_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Get objects in several Maya sets with one batched membership query.
+        
+        Args:
+            set_names: Names of the sets
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_members = []
-            for member in clean_members:
-                if member and member not in seen:
-                    seen.add(member)
-                    unique_members.append(member)
+        Returns:
+            Object names keyed by set name; sets that don't exist are omitted
             
-            return unique_members
+        Raises:
+            MayaOperationError: If the query fails
+        """
+        try:
+            members_by_set = self.maya_scene.get_set_members_many(set_names)
+            return {
+                set_name: self._members_to_objects(members)
+                for set_name, members in members_by_set.items()
+            }
         except Exception as e:
-            raise MayaOperationError(f"Failed to get objects from set '{set_name}': {e}")
+            raise MayaOperationError(f"Failed to get objects from sets: {e}")
+    
+    def _members_to_objects(self, members: List[str]) -> List[str]:
+        """
+        Reduce raw set members to unique, fully resolved object names.
+        
+        Args:
+            members: Set members as returned by Maya
+            
+        Returns:
+            List of object names
+        """
+        # Strip component suffixes and dedupe (order preserved) before
+        # resolving, so an object listed once per component resolves once;
+        # whole-object members have no "[" and skip the regex entirely
+        sub = _COMPONENT_SUFFIX_RE.sub
+        object_names = dict.fromkeys(
+            sub("", member) if "[" in member else member
+            for member in members if member
+        )
+        
+        # Resolve to long (full DAG) path to avoid ambiguity
+        resolved = (self.maya_scene.get_dag_path(name) or name for name in object_names)
+        return [name for name in dict.fromkeys(resolved) if name]
     
     def add_objects_to_set(self, set_name: str, objects: List[str]) -> None:
         """
@@ -183,7 +275,7 @@ class SetManager:
             SetNotFoundError: If set doesn't exist
             MayaOperationError: If operation fails
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         if not objects:
@@ -191,7 +283,7 @@ class SetManager:
         
         try:
             self.maya_scene.add_to_set(objects, set_name)
-            logger.debug(f"Added {len(objects)} objects to set '{set_name}'")
+            logger.debug("Added %s objects to set '%s'", len(objects), set_name)
         except Exception as e:
             raise MayaOperationError(f"Failed to add objects to set '{set_name}': {e}")
     
@@ -207,7 +299,7 @@ class SetManager:
             SetNotFoundError: If set doesn't exist
             MayaOperationError: If operation fails
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         if not objects:
@@ -215,7 +307,7 @@ class SetManager:
         
         try:
             self.maya_scene.remove_from_set(objects, set_name)
-            logger.debug(f"Removed {len(objects)} objects from set '{set_name}'")
+            logger.debug("Removed %s objects from set '%s'", len(objects), set_name)
         except Exception as e:
             raise MayaOperationError(f"Failed to remove objects from set '{set_name}': {e}")
     
@@ -230,14 +322,16 @@ class SetManager:
             SetNotFoundError: If set doesn't exist
             MayaOperationError: If operation fails
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         try:
             members = self.maya_scene.get_set_members(set_name)
-            if members:
-                self.maya_scene.remove_from_set(members, set_name)
-                logger.debug(f"Cleared {len(members)} objects from set '{set_name}'")
+            if not members:
+                return
+            
+            self.maya_scene.remove_from_set(members, set_name)
+            logger.debug("Cleared %s objects from set '%s'", len(members), set_name)
         except Exception as e:
             raise MayaOperationError(f"Failed to clear set '{set_name}': {e}")
     
@@ -245,21 +339,35 @@ class SetManager:
         """
         List all export sets in the scene.
         
+        Uses a single wildcard query, so only sets that exist are returned.
+        The result is cached until an objectSet is added, removed or renamed,
+        or the scene changes.
+        
         Returns:
             List of export set names
         """
+        generation = self.maya_scene.get_set_generation()
+        if self._list_cache is not None and self._cache_gen == generation:
+            return list(self._list_cache)
+        
         try:
-            all_sets = self.maya_scene.list_objects(object_type="objectSet")
-            export_sets = [s for s in all_sets if s.startswith(SET_PREFIX)]
-            return export_sets
+            export_sets = self.maya_scene.list_objects(
+                object_type="objectSet", pattern=f"{SET_PREFIX}*"
+            )
+            self._list_cache = export_sets
+            self._cache_gen = generation
+            return list(export_sets)
         except Exception as e:
-            logger.error(f"Failed to list export sets: {e}")
+            logger.error("Failed to list export sets: %s", e)
             return []
     
     def duplicate_set(self, set_name: str, new_display_name: str) -> str:
         """
         Duplicate a Maya set with its contents.
         
+        The new set holds the same objects get_set_objects reports for the
+        source: component members (.vtx[], .f[], .e[]) become whole objects.
+        
         Args:
             set_name: Name of the set to duplicate
             new_display_name: Display name for the new set
@@ -271,25 +379,31 @@ class SetManager:
             SetNotFoundError: If source set doesn't exist
             MayaOperationError: If duplication fails
         """
-        if not self.maya_scene.object_exists(set_name):
+        if not self._set_exists(set_name):
             raise SetNotFoundError(f"Set does not exist: {set_name}")
         
         try:
-            # Get objects from original set
-            objects = self.get_set_objects(set_name)
-            
-            # Create new set
             new_set_name = self.get_unique_set_name(new_display_name)
+            members = self.maya_scene.get_set_members(set_name)
+            
+            copied = False
+            if not any("[" in member for member in members):
+                # Whole-object members copy as-is, so Maya can create and
+                # populate the set from the source in one call
+                try:
+                    new_set_name = self.maya_scene.copy_set(set_name, new_set_name)
+                    copied = True
+                except Exception as e:
+                    logger.debug("Set copy failed, duplicating member by member: %s", e)
             
-            # Create set with objects
-            if objects:
-                # Maya's sets command can create and populate in one call
-                self.maya_scene.create_set(new_set_name, empty=True)
-                self.maya_scene.add_to_set(objects, new_set_name)
-            else:
-                self.maya_scene.create_set(new_set_name, empty=True)
+            if not copied:
+                objects = self._members_to_objects(members)
+                new_set_name = self.maya_scene.create_set(new_set_name, empty=True)
+                if objects:
+                    self.maya_scene.add_to_set(objects, new_set_name)
             
-            logger.info(f"Duplicated set '{set_name}' as '{new_set_name}'")
+            self._track_set(added=new_set_name)
+            logger.info("Duplicated set '%s' as '%s'", set_name, new_set_name)
             return new_set_name
         except Exception as e:
             raise MayaOperationError(f"Failed to duplicate set '{set_name}': {e}")
@@ -3,15 +3,34 @@ Type Definitions
 Custom types and type aliases for the batch exporter.
 """
 
+from dataclasses import dataclass
 from typing import TypedDict, List, Literal
 
 
 class ExportGroupDict(TypedDict):
-    """Type definition for export group data structure."""
+    """Type definition for serialized export group data."""
     name: str
     set_name: str
 
 
+@dataclass
+class ExportGroup:
+    """In-memory export group backed by a Maya set."""
+    __slots__ = ("name", "set_name")
+    
+    name: str
+    set_name: str
+    
+    @classmethod
+    def from_dict(cls, data: ExportGroupDict) -> "ExportGroup":
+        """Build a group from its serialized form."""
+        return cls(name=data.get("name", "untitled"), set_name=data.get("set_name", ""))
+    
+    def to_dict(self) -> ExportGroupDict:
+        """Serialize the group for the config file."""
+        return {"name": self.name, "set_name": self.set_name}
+
+
 class FBXSettingsDict(TypedDict):
     """Type definition for FBX export settings."""
     up_axis: Literal["Y", "Z"]
@@ -23,7 +42,7 @@ class FBXSettingsDict(TypedDict):
 
 class ExportDataDict(TypedDict):
     """Type definition for complete export configuration."""
-    export_groups: List[ExportGroupDict]
+    export_groups: List[ExportGroup]  # Serialized as ExportGroupDict
     fbx_settings: FBXSettingsDict
     expanded_groups: List[str]  # List of set_names that are expanded
 
@@ -34,3 +53,17 @@ class ExportResultDict(TypedDict):
     success: bool
     message: str
 
+
+@dataclass(frozen=True)
+class ExportResult:
+    """In-memory outcome of exporting one group."""
+    __slots__ = ("group_name", "success", "message")
+    
+    group_name: str
+    success: bool
+    message: str
+    
+    def to_dict(self) -> ExportResultDict:
+        """Serialize the result to its dictionary form."""
+        return {"group_name": self.group_name, "success": self.success, "message": self.message}
+
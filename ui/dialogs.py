@@ -10,7 +10,7 @@ try:
 except ImportError:
     from PySide6 import QtCore, QtWidgets
 
-from ..types import ExportResultDict
+from ..types import ExportResult
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -136,7 +136,7 @@ class ExportResultsDialog:
             )
     
     @staticmethod
-    def show_batch_results(results: List[ExportResultDict], success_count: int, 
+    def show_batch_results(results: List[ExportResult], success_count: int, 
                           total_count: int, parent=None) -> None:
         """
         Show batch export results.
@@ -150,8 +150,8 @@ class ExportResultsDialog:
         message = f"Exported {success_count} of {total_count} groups successfully.\n\n"
         
         for result in results:
-            status = "SUCCESS" if result["success"] else "FAILED"
-            message += f"{status}: {result['group_name']}\n{result['message']}\n\n"
+            status = "SUCCESS" if result.success else "FAILED"
+            message += f"{status}: {result.group_name}\n{result.message}\n\n"
         
         if success_count == total_count:
             QtWidgets.QMessageBox.information(
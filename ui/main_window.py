@@ -20,7 +20,7 @@ try:
 except ImportError:
     from shiboken6 import wrapInstance
 
-from ..container import get_container
+from ..container import get_container, reset_container
 from ..maya_facade import MayaSceneInterface
 from ..data_manager import DataManager
 from ..exporters.export_service import ExportService
@@ -67,6 +67,9 @@ class BatchExporterWindow(QtWidgets.QWidget):
         
         # Get dependencies from container
         container = get_container()
+        # The container's scene callbacks live as long as this window; a lambda
+        # (not a bound method) so it still runs while the widget is torn down
+        self.destroyed.connect(lambda *args: reset_container(container))
         self.data_manager = container.get_data_manager()
         self.export_service = container.get_export_service()
         self.maya_scene = container.get_maya_scene()
@@ -331,17 +334,17 @@ class BatchExporterWindow(QtWidgets.QWidget):
             
             # Only load if file exists (silent if not)
             if os.path.exists(config_path):
-                logger.info(f"Auto-loading config: {config_path}")
+                logger.info("Auto-loading config: %s", config_path)
                 success, message = self.data_manager.load_from_file(config_path)
                 if success:
-                    logger.info(f"Auto-loaded config successfully")
+                    logger.info("Auto-loaded config successfully")
                 else:
                     # Failed to load - just log, don't show error to user
-                    logger.debug(f"Could not auto-load config: {message}")
+                    logger.debug("Could not auto-load config: %s", message)
             # No logging if file doesn't exist - normal for new scenes
         except Exception as e:
             # Silently handle any errors - don't interrupt startup
-            logger.debug(f"Auto-load skipped: {e}")
+            logger.debug("Auto-load skipped: %s", e)
     
     def _on_timer_refresh(self) -> None:
         """Handle timer-based refresh."""
@@ -412,6 +415,9 @@ class BatchExporterWindow(QtWidgets.QWidget):
         import importlib
         import sys
         
+        # Drop the old adapter's Maya callbacks before its modules are replaced
+        reset_container()
+        
         modules_to_reload = [
             mod for mod in sys.modules.keys() 
             if mod.startswith('batch_exporter')
@@ -422,7 +428,7 @@ class BatchExporterWindow(QtWidgets.QWidget):
                 try:
                     importlib.reload(sys.modules[mod_name])
                 except Exception as e:
-                    logger.warning(f"Could not reload module {mod_name}: {e}")
+                    logger.warning("Could not reload module %s: %s", mod_name, e)
         
         from ..ui.main_window import show_batch_exporter
         show_batch_exporter()
@@ -458,13 +464,9 @@ class BatchExporterWindow(QtWidgets.QWidget):
         menu = QtWidgets.QMenu(self)
         
         # Find the group's current index
-        set_name = group_data["set_name"]
+        set_name = group_data.set_name
         groups = self.data_manager.get_all_export_groups()
-        current_index = None
-        for i, group in enumerate(groups):
-            if group.get("set_name") == set_name:
-                current_index = i
-                break
+        current_index = self.data_manager.find_group_index(set_name)
         
         # Movement actions
         move_up_action = menu.addAction("Move Up")
@@ -525,62 +527,56 @@ class BatchExporterWindow(QtWidgets.QWidget):
     
     def _rename_group(self, group_data) -> None:
         """Rename a group."""
-        current_name = group_data["name"]
-        set_name = group_data["set_name"]
+        current_name = group_data.name
+        set_name = group_data.set_name
         
         new_name = RenameGroupDialog.get_new_name(current_name, self)
         if new_name:
-            groups = self.data_manager.get_all_export_groups()
-            for i, group in enumerate(groups):
-                if group.get("set_name") == set_name:
-                    if self.data_manager.update_export_group(i, name=new_name):
-                        self.tree_widget.refresh(preserve_selection=True)
-                    else:
-                        InfoDialog.show_error("Error", "Failed to rename group")
-                    break
+            index = self.data_manager.find_group_index(set_name)
+            if index is not None:
+                if self.data_manager.update_export_group(index, name=new_name):
+                    self.tree_widget.refresh(preserve_selection=True)
+                else:
+                    InfoDialog.show_error("Error", "Failed to rename group")
     
     def _duplicate_group(self, group_data) -> None:
         """Duplicate a group."""
-        set_name = group_data["set_name"]
+        set_name = group_data.set_name
         
-        groups = self.data_manager.get_all_export_groups()
-        for i, group in enumerate(groups):
-            if group.get("set_name") == set_name:
-                new_index = self.data_manager.duplicate_export_group(i)
-                if new_index is not None:
-                    self.tree_widget.refresh(preserve_selection=False)
-                    self.toolbar.update_summary()
-                else:
-                    InfoDialog.show_error("Error", "Failed to duplicate group")
-                break
+        index = self.data_manager.find_group_index(set_name)
+        if index is not None:
+            new_index = self.data_manager.duplicate_export_group(index)
+            if new_index is not None:
+                self.tree_widget.refresh(preserve_selection=False)
+                self.toolbar.update_summary()
+            else:
+                InfoDialog.show_error("Error", "Failed to duplicate group")
     
     def _delete_group(self, group_data) -> None:
         """Delete a group."""
-        if ConfirmDeleteDialog.confirm(f"Delete group '{group_data['name']}'?", self):
-            set_name = group_data["set_name"]
-            groups = self.data_manager.get_all_export_groups()
-            for i, group in enumerate(groups):
-                if group.get("set_name") == set_name:
-                    if self.data_manager.remove_export_group(i):
-                        self.tree_widget.refresh(preserve_selection=True)
-                        self.toolbar.update_summary()
-                    else:
-                        InfoDialog.show_error("Error", "Failed to delete group")
-                    break
+        if ConfirmDeleteDialog.confirm(f"Delete group '{group_data.name}'?", self):
+            set_name = group_data.set_name
+            index = self.data_manager.find_group_index(set_name)
+            if index is not None:
+                if self.data_manager.remove_export_group(index):
+                    self.tree_widget.refresh(preserve_selection=True)
+                    self.toolbar.update_summary()
+                else:
+                    InfoDialog.show_error("Error", "Failed to delete group")
     
     def _move_group_up(self, index: int) -> None:
         """Move a group up in the list."""
         if self.data_manager.move_group_up(index):
             self.tree_widget.refresh(preserve_selection=True)
         else:
-            logger.warning(f"Cannot move group at index {index} up")
+            logger.warning("Cannot move group at index %s up", index)
     
     def _move_group_down(self, index: int) -> None:
         """Move a group down in the list."""
         if self.data_manager.move_group_down(index):
             self.tree_widget.refresh(preserve_selection=True)
         else:
-            logger.warning(f"Cannot move group at index {index} down")
+            logger.warning("Cannot move group at index %s down", index)
     
     def _on_move_up_clicked(self) -> None:
         """Handle move up button click."""
@@ -601,18 +597,19 @@ class BatchExporterWindow(QtWidgets.QWidget):
             groups_to_remove = info["groups"]
             objects_to_remove = info["objects_by_group"]
             
-            if groups_to_remove:
-                if ConfirmDeleteDialog.confirm(f"Delete {len(groups_to_remove)} group(s)?", self):
-                    for group_data in groups_to_remove:
-                        set_name = group_data["set_name"]
-                        groups = self.data_manager.get_all_export_groups()
-                        for i, group in enumerate(groups):
-                            if group.get("set_name") == set_name:
-                                self.data_manager.remove_export_group(i)
-                                break
+            delete_groups = bool(groups_to_remove) and ConfirmDeleteDialog.confirm(
+                f"Delete {len(groups_to_remove)} group(s)?", self
+            )
             
-            for set_name, objects in objects_to_remove.items():
-                self.data_manager.remove_objects_from_set(set_name, objects)
+            with self.data_manager.batch():
+                if delete_groups:
+                    for group_data in groups_to_remove:
+                        index = self.data_manager.find_group_index(group_data.set_name)
+                        if index is not None:
+                            self.data_manager.remove_export_group(index)
+                
+                for set_name, objects in objects_to_remove.items():
+                    self.data_manager.remove_objects_from_set(set_name, objects)
             
             self.tree_widget.refresh(preserve_selection=True)
             self.toolbar.update_summary()
@@ -635,14 +632,15 @@ class BatchExporterWindow(QtWidgets.QWidget):
         
         # Add objects to each selected group
         success_count = 0
-        for group in selected_groups:
-            set_name = group.get("set_name")
-            if set_name:
-                if self.data_manager.add_objects_to_set(set_name, selected):
-                    success_count += 1
+        with self.data_manager.batch():
+            for group in selected_groups:
+                set_name = group.set_name
+                if set_name:
+                    if self.data_manager.add_objects_to_set(set_name, selected):
+                        success_count += 1
         
         if success_count > 0:
-            logger.info(f"Added {len(selected)} objects to {success_count} groups")
+            logger.info("Added %s objects to %s groups", len(selected), success_count)
             self.tree_widget.refresh(preserve_selection=True)
             self.toolbar.update_summary()
             if success_count > 1:
@@ -668,14 +666,15 @@ class BatchExporterWindow(QtWidgets.QWidget):
         
         # Remove objects from each selected group
         success_count = 0
-        for group in selected_groups:
-            set_name = group.get("set_name")
-            if set_name:
-                if self.data_manager.remove_objects_from_set(set_name, selected):
-                    success_count += 1
+        with self.data_manager.batch():
+            for group in selected_groups:
+                set_name = group.set_name
+                if set_name:
+                    if self.data_manager.remove_objects_from_set(set_name, selected):
+                        success_count += 1
         
         if success_count > 0:
-            logger.info(f"Removed {len(selected)} objects from {success_count} groups")
+            logger.info("Removed %s objects from %s groups", len(selected), success_count)
             self.tree_widget.refresh(preserve_selection=True)
             self.toolbar.update_summary()
             if success_count > 1:
@@ -690,7 +689,7 @@ class BatchExporterWindow(QtWidgets.QWidget):
         
         # Add objects from selected groups
         for group in info["groups"]:
-            set_name = group.get("set_name")
+            set_name = group.set_name
             if set_name:
                 objects_to_select.extend(self.data_manager.get_set_objects(set_name))
         
@@ -799,7 +798,7 @@ class BatchExporterWindow(QtWidgets.QWidget):
         settings = self.data_manager.get_fbx_settings()
         result = self.export_service.export_single_group(group, settings)
         
-        ExportResultsDialog.show_single_result(result["success"], result["message"], self)
+        ExportResultsDialog.show_single_result(result.success, result.message, self)
     
     def _export_all_groups(self) -> None:
         """Export all groups."""
@@ -874,25 +873,20 @@ class BatchExporterWindow(QtWidgets.QWidget):
             else:
                 obj_data["type"] = "transform"
                 
-                # Get transform data
-                position = self.maya_scene.get_world_position(obj)
-                if position:
+                # Get transform data (position, rotation and scale in one call)
+                transform = self.maya_scene.get_world_transform(obj)
+                if transform:
+                    position, rotation, scale = transform
                     obj_data["position"] = {
                         "x": position[0],
                         "y": position[1],
                         "z": position[2]
                     }
-                
-                rotation = self.maya_scene.get_world_rotation(obj)
-                if rotation:
                     obj_data["rotation"] = {
                         "x": rotation[0],
                         "y": rotation[1],
                         "z": rotation[2]
                     }
-                
-                scale = self.maya_scene.get_world_scale(obj)
-                if scale:
                     obj_data["scale"] = {
                         "x": scale[0],
                         "y": scale[1],
@@ -911,14 +905,14 @@ class BatchExporterWindow(QtWidgets.QWidget):
                 f"Exported {len(selected)} object(s) to:\n{file_path}",
                 self
             )
-            logger.info(f"Exported {len(selected)} objects to {file_path}")
+            logger.info("Exported %s objects to %s", len(selected), file_path)
         except Exception as e:
             InfoDialog.show_error(
                 "Export Failed",
                 f"Failed to export objects:\n{str(e)}",
                 self
             )
-            logger.error(f"Failed to export scene JSON: {e}")
+            logger.error("Failed to export scene JSON: %s", e)
 
 
 def show_batch_exporter():
@@ -931,9 +925,12 @@ def show_batch_exporter():
     container = get_container()
     maya_scene = container.get_maya_scene()
     
-    # Delete existing workspace control if it exists
+    # Delete existing workspace control if it exists, along with the
+    # container (and scene callbacks) its window was using
     if maya_scene.workspace_control_exists(workspace_control_name):
         maya_scene.delete_ui(workspace_control_name)
+        reset_container()
+        maya_scene = get_container().get_maya_scene()
     
     # Create new workspace control
     maya_scene.create_workspace_control(
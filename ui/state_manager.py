@@ -34,10 +34,10 @@ class SelectionStateManager:
             index: Group index
         """
         if index is not None:
-            group = self.data_manager.get_export_group(index)
-            if group:
-                self.current_group_set_name = group.get("set_name")
-                logger.debug(f"Set current group to: {self.current_group_set_name}")
+            set_name = self.data_manager.get_set_name(index)
+            if set_name:
+                self.current_group_set_name = set_name
+                logger.debug("Set current group to: %s", self.current_group_set_name)
             else:
                 self.current_group_set_name = None
         else:
@@ -53,13 +53,7 @@ class SelectionStateManager:
         if not self.current_group_set_name:
             return None
         
-        # Find current index by set_name
-        groups = self.data_manager.get_all_export_groups()
-        for i, group in enumerate(groups):
-            if group.get("set_name") == self.current_group_set_name:
-                return i
-        
-        return None
+        return self.data_manager.find_group_index(self.current_group_set_name)
     
     def select_objects_in_scene(self, object_names: List[str]) -> None:
         """
@@ -71,9 +65,9 @@ class SelectionStateManager:
         if object_names:
             try:
                 self.maya_scene.select(object_names, replace=True)
-                logger.info(f"Selected {len(object_names)} objects in scene")
+                logger.info("Selected %s objects in scene", len(object_names))
             except Exception as e:
-                logger.error(f"Failed to select objects in scene: {e}")
+                logger.error("Failed to select objects in scene: %s", e)
     
     def add_selected_scene_objects_to_current_group(self) -> bool:
         """
@@ -95,11 +89,11 @@ class SelectionStateManager:
             
             success = self.data_manager.add_objects_to_set(self.current_group_set_name, selected)
             if success:
-                logger.info(f"Added {len(selected)} objects to group {self.current_group_set_name}")
+                logger.info("Added %s objects to group %s", len(selected), self.current_group_set_name)
             return success
             
         except Exception as e:
-            logger.error(f"Failed to add selected objects to group: {e}")
+            logger.error("Failed to add selected objects to group: %s", e)
             return False
 
 
@@ -132,17 +126,17 @@ class IsolationStateManager:
         try:
             group = self.data_manager.get_export_group(group_index)
             if not group:
-                logger.error(f"Group not found at index {group_index}")
+                logger.error("Group not found at index %s", group_index)
                 return False
             
-            set_name = group.get("set_name")
+            set_name = group.set_name
             if not set_name:
                 logger.error("Group has no set name")
                 return False
             
             objects = self.data_manager.get_set_objects(set_name)
             if not objects:
-                logger.warning(f"No objects in group '{group.get('name')}'")
+                logger.warning("No objects in group '%s'", group.name)
                 return False
             
             # Get active panel
@@ -151,7 +145,7 @@ class IsolationStateManager:
                 logger.warning("No active model panel found")
                 return False
             
-            logger.info(f"Isolating {len(objects)} objects from group '{group.get('name')}'")
+            logger.info("Isolating %s objects from group '%s'", len(objects), group.name)
             
             # Turn OFF isolation
             self.maya_scene.isolate_select(active_panel, state=False)
@@ -163,37 +157,36 @@ class IsolationStateManager:
             isolate_set = self.maya_scene.get_isolate_set(active_panel)
             
             if isolate_set:
-                logger.info(f"Isolation set name: {isolate_set}")
+                logger.info("Isolation set name: %s", isolate_set)
                 
                 try:
                     # Get current members
                     old_members = self.maya_scene.get_set_members(isolate_set)
-                    logger.info(f"OLD MEMBERS IN SET: {len(old_members)} - {old_members[:5] if len(old_members) > 5 else old_members}")
+                    logger.info("OLD MEMBERS IN SET: %s - %s", len(old_members), old_members[:5] if len(old_members) > 5 else old_members)
                     
                     # Remove all old members
                     if old_members:
                         self.maya_scene.remove_from_set(old_members, isolate_set)
-                        logger.info(f"REMOVED {len(old_members)} old objects")
+                        logger.info("REMOVED %s old objects", len(old_members))
                     
                     # Add ONLY our objects
                     if objects:
                         self.maya_scene.add_to_set(objects, isolate_set)
-                        logger.info(f"ADDED {len(objects)} objects")
+                        logger.info("ADDED %s objects", len(objects))
                         
                         # Verify
                         final_members = self.maya_scene.get_set_members(isolate_set)
-                        logger.info(f"FINAL SET MEMBERS: {len(final_members)}")
+                        logger.info("FINAL SET MEMBERS: %s", len(final_members))
                 except Exception as e:
-                    logger.error(f"Error manipulating isolation set: {e}")
+                    logger.error("Error manipulating isolation set: %s", e)
             else:
                 logger.warning("Could not find isolation set! Trying fallback method...")
                 # Fallback: Use Maya's direct isolation API
                 try:
-                    for obj in objects:
-                        self.maya_scene.isolate_select(active_panel, add_dag_object=obj)
-                    logger.info(f"Added {len(objects)} objects using addDagObject fallback")
+                    self.maya_scene.add_to_isolate_set(active_panel, objects)
+                    logger.info("Added %s objects using addSelected fallback", len(objects))
                 except Exception as e:
-                    logger.error(f"Fallback method failed: {e}")
+                    logger.error("Fallback method failed: %s", e)
             
             # Select the objects for visual feedback
             self.maya_scene.select(objects, replace=True)
@@ -201,11 +194,11 @@ class IsolationStateManager:
             self.is_isolated = True
             self.isolated_panel = active_panel
             
-            logger.info(f"Successfully isolated group '{group.get('name')}' in {active_panel}")
+            logger.info("Successfully isolated group '%s' in %s", group.name, active_panel)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to isolate group: {e}")
+            logger.error("Failed to isolate group: %s", e)
             return False
     
     def unisolate(self) -> bool:
@@ -222,10 +215,10 @@ class IsolationStateManager:
         try:
             # Simply turn off isolation for the panel
             self.maya_scene.isolate_select(self.isolated_panel, state=False)
-            logger.info(f"Unisolated panel {self.isolated_panel}")
+            logger.info("Unisolated panel %s", self.isolated_panel)
         except Exception as e:
             # Panel might not exist anymore, which is fine
-            logger.warning(f"Could not unisolate panel {self.isolated_panel}: {e}")
+            logger.warning("Could not unisolate panel %s: %s", self.isolated_panel, e)
         
         # Always reset state, even if command failed
         self.is_isolated = False
@@ -248,7 +241,7 @@ class IsolationStateManager:
             self.unisolate()
             return False
         else:
-            logger.debug(f"Turning ON isolation for group index {group_index}")
+            logger.debug("Turning ON isolation for group index %s", group_index)
             self.isolate_group(group_index)
             return self.is_isolated
     
@@ -85,16 +85,13 @@ class ExportToolbar(QtWidgets.QWidget):
     
     def update_summary(self) -> None:
         """Update the scene summary label."""
-        groups = self.data_manager.get_all_export_groups()
-        total_objects = 0
+        set_names = self.data_manager.get_all_set_names()
+        objects_by_set = self.data_manager.get_set_objects_many(
+            [set_name for set_name in set_names if set_name]
+        )
+        total_objects = sum(len(objects) for objects in objects_by_set.values())
         
-        for group in groups:
-            set_name = group.get("set_name")
-            if set_name:
-                objects = self.data_manager.get_set_objects(set_name)
-                total_objects += len(objects)
-        
-        self.summary_label.setText(f"{len(groups)} groups | {total_objects} objects")
+        self.summary_label.setText(f"{len(set_names)} groups | {total_objects} objects")
     
     def set_isolated_state(self, is_isolated: bool) -> None:
         """
@@ -4,7 +4,7 @@ Tree view for displaying export groups and their objects.
 """
 
 from typing import List, Set, Dict, Optional, Tuple
-from ...types import ExportGroupDict
+from ...types import ExportGroup
 
 try:
     from PySide2 import QtCore, QtWidgets, QtGui
@@ -122,7 +122,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                 if item:
                     item_data = item.data(0, QtCore.Qt.UserRole)
                     if item_data and item_data.get("type") == "group":
-                        set_name = item_data["data"].get("set_name")
+                        set_name = item_data["data"].set_name
                         if set_name and item.isExpanded():
                             expanded_groups.add(set_name)
             
@@ -132,11 +132,11 @@ class ExportTreeWidget(QtWidgets.QWidget):
             for item in self.tree_widget.selectedItems():
                 item_data = item.data(0, QtCore.Qt.UserRole)
                 if item_data and item_data.get("type") == "group":
-                    set_name = item_data["data"].get("set_name")
+                    set_name = item_data["data"].set_name
                     if set_name:
                         selected_groups.add(set_name)
                 elif item_data and item_data.get("type") == "object":
-                    parent_set = item_data["group"].get("set_name")
+                    parent_set = item_data["group"].set_name
                     obj_name = item_data["name"]
                     if parent_set and obj_name:
                         selected_objects.add((parent_set, obj_name))
@@ -147,12 +147,15 @@ class ExportTreeWidget(QtWidgets.QWidget):
         
         # Get groups
         groups = self.data_manager.get_all_export_groups()
+        objects_by_set = self.data_manager.get_set_objects_many(
+            [group.set_name for group in groups if group.set_name]
+        )
         
         items_to_select = []
         
         # Build tree
         for group in groups:
-            group_item = QtWidgets.QTreeWidgetItem([group["name"]])
+            group_item = QtWidgets.QTreeWidgetItem([group.name])
             group_item.setData(0, QtCore.Qt.UserRole, {"type": "group", "data": group})
             
             font = group_item.font(0)
@@ -160,9 +163,9 @@ class ExportTreeWidget(QtWidgets.QWidget):
             group_item.setFont(0, font)
             group_item.setForeground(0, QtGui.QColor(100, 150, 255))
             
-            set_name = group.get("set_name")
+            set_name = group.set_name
             if set_name:
-                objects = self.data_manager.get_set_objects(set_name)
+                objects = objects_by_set.get(set_name, [])
                 for obj in objects:
                     obj_item = QtWidgets.QTreeWidgetItem([obj])
                     obj_item.setData(0, QtCore.Qt.UserRole, {
@@ -199,7 +202,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                 self.tree_widget.itemSelectionChanged.disconnect(self._on_selection_changed)
             except (TypeError, RuntimeError) as e:
                 # Signal wasn't connected, which is fine
-                logger.debug(f"Could not disconnect signal: {e}")
+                logger.debug("Could not disconnect signal: %s", e)
             
             # Set current and select all
             self.tree_widget.setCurrentItem(items_to_select[0])
@@ -210,7 +213,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                     parent.setExpanded(True)
                     parent_data = parent.data(0, QtCore.Qt.UserRole)
                     if parent_data and parent_data.get("type") == "group":
-                        parent_set_name = parent_data["data"].get("set_name")
+                        parent_set_name = parent_data["data"].set_name
                         if parent_set_name and self.expanded_groups_state is not None:
                             self.expanded_groups_state.add(parent_set_name)
             
@@ -219,7 +222,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                 self.tree_widget.itemSelectionChanged.connect(self._on_selection_changed)
             except (TypeError, RuntimeError) as e:
                 # Connection failed, which is an error
-                logger.error(f"Could not reconnect signal: {e}")
+                logger.error("Could not reconnect signal: %s", e)
         
         # Re-apply search filter
         if self.search_edit.text():
@@ -267,7 +270,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
         """Handle item expanded."""
         item_data = item.data(0, QtCore.Qt.UserRole)
         if item_data and item_data.get("type") == "group":
-            set_name = item_data["data"].get("set_name")
+            set_name = item_data["data"].set_name
             if set_name:
                 if self.expanded_groups_state is None:
                     self.expanded_groups_state = set()
@@ -278,7 +281,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
         """Handle item collapsed."""
         item_data = item.data(0, QtCore.Qt.UserRole)
         if item_data and item_data.get("type") == "group":
-            set_name = item_data["data"].get("set_name")
+            set_name = item_data["data"].set_name
             if set_name and self.expanded_groups_state:
                 self.expanded_groups_state.discard(set_name)
                 self.data_manager.set_expanded_groups(list(self.expanded_groups_state))
@@ -295,19 +298,14 @@ class ExportTreeWidget(QtWidgets.QWidget):
             
             if item_data and item_data.get("type") == "group":
                 # Find group index
-                groups = self.data_manager.get_all_export_groups()
-                for i, group in enumerate(groups):
-                    if group.get("set_name") == item_data["data"].get("set_name"):
-                        self.group_selected.emit(i)
-                        break
+                index = self.data_manager.find_group_index(item_data["data"].set_name)
+                if index is not None:
+                    self.group_selected.emit(index)
             elif item_data and item_data.get("type") == "object":
                 # Find group index
-                groups = self.data_manager.get_all_export_groups()
-                parent_set = item_data["group"].get("set_name")
-                for i, group in enumerate(groups):
-                    if group.get("set_name") == parent_set:
-                        self.object_selected.emit(i, item_data["name"])
-                        break
+                index = self.data_manager.find_group_index(item_data["group"].set_name)
+                if index is not None:
+                    self.object_selected.emit(index, item_data["name"])
     
     def get_selected_group_index(self) -> Optional[int]:
         """
@@ -330,10 +328,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                 item_data = item.data(0, QtCore.Qt.UserRole)
         
         if item_data and item_data.get("type") == "group":
-            groups = self.data_manager.get_all_export_groups()
-            for i, group in enumerate(groups):
-                if group.get("set_name") == item_data["data"].get("set_name"):
-                    return i
+            return self.data_manager.find_group_index(item_data["data"].set_name)
         
         return None
     
@@ -356,7 +351,7 @@ class ExportTreeWidget(QtWidgets.QWidget):
                 groups.append(item_data["data"])
             elif item_data and item_data.get("type") == "object":
                 group = item_data["group"]
-                set_name = group.get("set_name")
+                set_name = group.set_name
                 obj_name = item_data["name"]
                 
                 if set_name not in objects_by_group:
@@ -3,9 +3,10 @@ Input Validators
 Validation logic for user inputs and data.
 """
 
+import functools
 import os
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .exceptions import ValidationError
 from .logger import get_logger
 
@@ -57,10 +58,14 @@ class NameValidator:
         return name
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def sanitize_for_maya_name(name: str) -> str:
         """
         Sanitize a name to be safe for Maya object names.
         
+        Results are memoized since the same group names are sanitized on
+        every create, rename and unique-name lookup.
+        
         Args:
             name: The name to sanitize
             
@@ -113,7 +118,7 @@ class PathValidator:
         
         # Check if it's an absolute path
         if not os.path.isabs(path):
-            logger.warning(f"Directory path is not absolute: {path}")
+            logger.warning("Directory path is not absolute: %s", path)
         
         # Check existence if required
         if must_exist and not os.path.exists(path):
@@ -148,16 +153,9 @@ class PathValidator:
         if not isinstance(path, str):
             raise ValidationError(f"File path must be a string, got {type(path)}")
         
-        # Normalize path
-        path = os.path.normpath(path)
-        
-        # Check extension if specified
-        if extensions:
-            _, ext = os.path.splitext(path)
-            if ext.lower() not in [e.lower() for e in extensions]:
-                raise ValidationError(
-                    f"Invalid file extension. Expected one of {extensions}, got '{ext}'"
-                )
+        # Normalization and the extension check are memoized; the filesystem
+        # checks below always run
+        path = PathValidator._normalize_file_path(path, tuple(extensions) if extensions else ())
         
         # Check existence if required
         if must_exist and not os.path.exists(path):
@@ -169,6 +167,36 @@ class PathValidator:
         
         return path
     
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _normalize_file_path(path: str, extensions: Tuple[str, ...]) -> str:
+        """
+        Normalize a file path and check its extension.
+        
+        Pure string work, so results are memoized; invalid paths raise and
+        are never cached.
+        
+        Args:
+            path: The file path to normalize
+            extensions: Valid extensions, empty to allow any
+            
+        Returns:
+            Normalized file path
+            
+        Raises:
+            ValidationError: If the extension is not allowed
+        """
+        path = os.path.normpath(path)
+        
+        if extensions:
+            _, ext = os.path.splitext(path)
+            if ext.lower() not in [e.lower() for e in extensions]:
+                raise ValidationError(
+                    f"Invalid file extension. Expected one of {list(extensions)}, got '{ext}'"
+                )
+        
+        return path
+    
     @staticmethod
     def is_path_writable(path: str) -> bool:
         """
@@ -192,6 +220,6 @@ class PathValidator:
             
             return os.access(parent, os.W_OK)
         except Exception as e:
-            logger.warning(f"Error checking if path is writable: {e}")
+            logger.warning("Error checking if path is writable: %s", e)
             return False
 